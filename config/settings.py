@@ -2,7 +2,8 @@
 Configuration settings for the AutoCAD MCP Server
 """
 import os
-from typing import Dict, Any
+from dataclasses import dataclass, fields
+from typing import Dict, Any, Mapping
 
 class Config:
     """Base configuration class"""
@@ -15,11 +16,19 @@ class Config:
     # AutoCAD configuration
     AUTOCAD_APPLICATION_NAME = "AutoCAD.Application"
     AUTOCAD_TIMEOUT = 30  # seconds
+    MIN_AUTOCAD_INSTANCES = 1  # pooled connections opened at startup
     MAX_AUTOCAD_INSTANCES = 5
+    LISP_RESULT_CACHE_SIZE = 512  # idempotent LISP results kept per server
     
     # Server configuration
     HOST = os.environ.get('HOST') or '127.0.0.1'
     PORT = int(os.environ.get('PORT') or 5000)
+    SERVER_THREADS = 8  # WSGI worker threads when not in debug mode
+    
+    # Response compression (Flask-Compress)
+    COMPRESS_ALGORITHM = ['br', 'gzip']
+    COMPRESS_MIN_SIZE = 512  # bytes
+    COMPRESS_STREAMS = False  # keep server-sent events unbuffered
     
     # Logging configuration
     LOG_LEVEL = os.environ.get('LOG_LEVEL') or 'INFO'
@@ -53,6 +62,44 @@ class TestingConfig(Config):
     DEBUG = True
     LOG_LEVEL = 'DEBUG'
 
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Immutable snapshot of the settings read by the server at runtime"""
+    
+    # Server configuration
+    HOST: str
+    PORT: int
+    SERVER_THREADS: int
+    DEBUG: bool
+    
+    # AutoCAD configuration
+    AUTOCAD_APPLICATION_NAME: str
+    AUTOCAD_TIMEOUT: float
+    MIN_AUTOCAD_INSTANCES: int
+    MAX_AUTOCAD_INSTANCES: int
+    LISP_RESULT_CACHE_SIZE: int
+    
+    # Logging configuration
+    LOG_LEVEL: str
+    LOG_FILE: str
+    
+    # Drawing defaults
+    DEFAULT_LAYER_COLOR: int
+    DEFAULT_LINE_TYPE: str
+    DEFAULT_LINE_WEIGHT: float
+    DEFAULT_TEXT_HEIGHT: float
+    
+    # Building code defaults
+    MIN_DOOR_WIDTH: float
+    MIN_WINDOW_WIDTH: float
+    MIN_ROOM_AREA: float
+    MAX_WALL_HEIGHT: float
+    
+    @classmethod
+    def from_mapping(cls, mapping: Mapping[str, Any]) -> 'Settings':
+        """Build settings from a mapping such as a loaded Flask app.config"""
+        return cls(**{field.name: mapping[field.name] for field in fields(cls)})
+
 # Configuration dictionary
 config = {
     'development': DevelopmentConfig,
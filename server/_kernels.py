@@ -0,0 +1,24 @@
+"""
+Optional Numba kernels for large geometry inputs
+"""
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Below this many vertices the NumPy path is already faster than a JIT call
+NUMBA_MIN_POINTS = 1024
+
+if NUMBA_AVAILABLE:
+    @njit('f8(f8[:, ::1])', fastmath=True, cache=True)
+    def shoelace_area(coords):
+        """Shoelace area of the polygon whose vertices are the rows of `coords`"""
+        n = coords.shape[0]
+        total = 0.0
+        for i in range(n - 1):
+            total += coords[i, 0] * coords[i + 1, 1] - coords[i + 1, 0] * coords[i, 1]
+        total += coords[n - 1, 0] * coords[0, 1] - coords[0, 0] * coords[n - 1, 1]
+        return abs(total) / 2.0
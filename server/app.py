@@ -2,38 +2,81 @@
 AutoCAD MCP Server - Flask Application
 Main server application for architectural floor planning with AutoCAD integration
 """
+import atexit
 import logging
 import os
-from flask import Flask, request, jsonify
+import orjson
+from contextlib import contextmanager
+from operator import itemgetter
+from flask import Flask, Response, request, jsonify, g, stream_with_context
 from flask_cors import CORS
-from typing import Dict, Any, List
+from flask_compress import Compress
+from flask.json.provider import DefaultJSONProvider
+from typing import Any, Callable, Dict, Iterator, Optional
 
 # Import our modules
-from config.settings import get_config
+from config.settings import Settings, get_config
 from server.autocad_interface import AutoCADInterface
 from server.lisp_generator import LispGenerator
 from server.models import (Point, Wall, Door, Window, Room, Layer, SwingDirection,
-                           FurnitureType, DoorType, WindowType, GlassType)
+                           FurnitureType, DoorType, WindowType, GlassType, LispExecutionResult)
+from server.pool import AutoCADPool
+from server.schemas import (
+    WALL_SCHEMA, DOOR_SCHEMA, WINDOW_SCHEMA, DOOR_SIMPLE_SCHEMA, WINDOW_SIMPLE_SCHEMA,
+    ROOM_SCHEMA, GRID_SCHEMA, LAYER_SCHEMA, TEXT_SCHEMA, DIMENSION_SCHEMA,
+    FURNITURE_SCHEMA, BATCH_SCHEMA, AREA_SCHEMA, LISP_SCHEMA, SAVE_SCHEMA
+)
 from server.utils import (
-    setup_logging, validate_point, validate_positive_number, 
-    calculate_area_from_points, ValidationError, AutoCADConnectionError
+    setup_logging, calculate_area_from_points, ValidationError, AutoCADConnectionError,
+    AutoCADPoolTimeoutError
 )
 
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, serializing NumPy values natively"""
+    
+    options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=self.default, option=self.options).decode()
+    
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
 # Initialize Flask app
 app = Flask(__name__)
-config = get_config()
-app.config.from_object(config)
-CORS(app)
+app.json = OrjsonProvider(app)
+config_class = get_config()
+app.config.from_object(config_class)
+app.config.from_prefixed_env("ACAD")
+config = Settings.from_mapping(app.config)
+CORS(app, resources={r"/api/*": {"origins": "*"}})
+Compress(app)
 
 # Setup logging
 logger = setup_logging(config.LOG_LEVEL, config.LOG_FILE)
 
+# Building code thresholds and their error messages, fixed at startup
+MIN_DOOR_WIDTH = config.MIN_DOOR_WIDTH
+MIN_WINDOW_WIDTH = config.MIN_WINDOW_WIDTH
+MIN_ROOM_AREA = config.MIN_ROOM_AREA
+_DOOR_WIDTH_ERROR = f"Door width must be at least {MIN_DOOR_WIDTH} inches"
+_WINDOW_WIDTH_ERROR = f"Window width must be at least {MIN_WINDOW_WIDTH} inches"
+_ROOM_AREA_ERROR = f"Room area must be at least {MIN_ROOM_AREA} square feet"
+
 # Initialize AutoCAD interface and LISP generator
 autocad_interface = AutoCADInterface(
     application_name=config.AUTOCAD_APPLICATION_NAME,
-    timeout=config.AUTOCAD_TIMEOUT
+    timeout=config.AUTOCAD_TIMEOUT,
+    result_cache_size=config.LISP_RESULT_CACHE_SIZE
 )
+atexit.register(autocad_interface.shutdown)
 lisp_generator = LispGenerator()
+autocad_pool = AutoCADPool(
+    autocad_interface,
+    min_size=config.MIN_AUTOCAD_INSTANCES,
+    max_size=config.MAX_AUTOCAD_INSTANCES,
+    timeout=config.AUTOCAD_TIMEOUT
+)
 
 # Error handlers
 @app.errorhandler(ValidationError)
@@ -42,49 +85,183 @@ def handle_validation_error(error):
 
 @app.errorhandler(AutoCADConnectionError)
 def handle_autocad_error(error):
-    return jsonify({"error": "AutoCAD Connection Error", "message": str(error)}), 500
+    return jsonify({"error": "AutoCAD Connection Error", "message": str(error)}), 503
+
+@app.errorhandler(AutoCADPoolTimeoutError)
+def handle_pool_timeout(error):
+    return jsonify({"error": "AutoCAD Busy", "message": str(error)}), 503
 
 @app.errorhandler(500)
 def handle_internal_error(error):
     logger.error(f"Internal server error: {str(error)}")
     return jsonify({"error": "Internal Server Error", "message": "An unexpected error occurred"}), 500
 
+@app.before_request
+def parse_json_body():
+    """Parse a JSON request body once with orjson and store it on g.json"""
+    g.json = None
+    if request.is_json:
+        body = request.get_data(cache=False)
+        if body:
+            try:
+                g.json = orjson.loads(body)
+            except orjson.JSONDecodeError as e:
+                raise ValidationError(f"Invalid JSON body: {str(e)}")
+
 # Helper functions
-def validate_request_data(data: Dict[str, Any], required_fields: List[str]) -> None:
-    """Validate that required fields are present in request data"""
-    missing_fields = [field for field in required_fields if field not in data]
-    if missing_fields:
-        raise ValidationError(f"Missing required fields: {', '.join(missing_fields)}")
-
-def parse_point(point_data: Dict[str, float]) -> Point:
-    """Parse point data from request"""
-    return Point(
-        x=float(point_data.get('x', 0)),
-        y=float(point_data.get('y', 0)),
-        z=float(point_data.get('z', 0))
-    )
-
-def parse_points_list(points_data: List[Dict[str, float]]) -> List[Point]:
-    """Parse list of points from request"""
-    return [parse_point(point_data) for point_data in points_data]
+@contextmanager
+def autocad_instance(data: Dict[str, Any]) -> Iterator[str]:
+    """Yield the requested instance_id, or a pooled connection's id when none is given"""
+    instance_id = data.get('instance_id')
+    if instance_id is not None:
+        yield instance_id
+        return
+    with autocad_pool.acquire() as connection:
+        yield connection.instance_id
+
+def run_lisp(lisp_code: str, data: Dict[str, Any], cacheable: bool = False,
+             batchable: bool = False) -> LispExecutionResult:
+    """Execute LISP code on the AutoCAD instance selected by the request.
+
+    Only server-generated code may be batchable; user-supplied LISP runs alone.
+    """
+    with autocad_instance(data) as instance_id:
+        return autocad_interface.execute_lisp(lisp_code, instance_id, cacheable, batchable)
+
+def room_area(points, _min_area=MIN_ROOM_AREA, _error=_ROOM_AREA_ERROR,
+              _area=calculate_area_from_points, _ValidationError=ValidationError) -> float:
+    """Validate room points and return the enclosed area"""
+    if len(points) < 3:
+        raise _ValidationError("Room must have at least 3 points")
+    
+    area = _area(points)
+    if area < _min_area:
+        raise _ValidationError(_error)
+    return area
+
+def pure(build: Callable[[Dict[str, Any]], str]) -> Callable[[Dict[str, Any]], str]:
+    """Mark a builder whose LISP leaves the drawing unchanged when re-run, so its result may be cached"""
+    build.pure = True
+    return build
+
+def is_pure(build: Callable[[Dict[str, Any]], str]) -> bool:
+    """Check whether a builder was marked with @pure"""
+    return getattr(build, 'pure', False)
+
+# LISP builders shared by the element routes and the batch route.
+# Each unpacks the validated fields it needs in one itemgetter call; the
+# validating builders also bind their thresholds as defaults (local lookups).
+_WALL_FIELDS = itemgetter('start_point', 'end_point', 'thickness', 'height')
+_DOOR_FIELDS = itemgetter('wall_reference', 'position', 'width', 'height', 'swing_direction',
+                          'door_type', 'wall_thickness', 'ref_id')
+_WINDOW_FIELDS = itemgetter('wall_reference', 'position', 'width', 'height', 'sill_height',
+                            'window_type', 'glass_type', 'ref_id')
+_DOOR_SIMPLE_FIELDS = itemgetter('position', 'width', 'height', 'door_type', 'ref_id')
+_WINDOW_SIMPLE_FIELDS = itemgetter('position', 'width', 'height', 'sill_height', 'window_type', 'ref_id')
+_ROOM_FIELDS = itemgetter('points', 'height')
+_GRID_FIELDS = itemgetter('origin_point', 'x_spacing', 'y_spacing', 'x_count', 'y_count')
+_LAYER_FIELDS = itemgetter('name', 'color', 'line_type', 'line_weight')
+_TEXT_FIELDS = itemgetter('insertion_point', 'text_string', 'height', 'rotation')
+_DIMENSION_FIELDS = itemgetter('start_point', 'end_point', 'offset_distance')
+_FURNITURE_FIELDS = itemgetter('insertion_point', 'furniture_type', 'rotation', 'scale')
+
+def build_wall(data: Dict[str, Any]) -> str:
+    return lisp_generator.create_wall(*_WALL_FIELDS(data))
+
+def build_door(data: Dict[str, Any], _fields=_DOOR_FIELDS, _min_width=MIN_DOOR_WIDTH,
+               _error=_DOOR_WIDTH_ERROR, _ValidationError=ValidationError) -> str:
+    wall_reference, position, width, height, swing, door_type, wall_thickness, ref_id = _fields(data)
+    if width < _min_width:
+        raise _ValidationError(_error)
+    return lisp_generator.insert_door(wall_reference, position, width, height, swing, door_type,
+                                      wall_thickness, ref_id)
+
+def build_window(data: Dict[str, Any], _fields=_WINDOW_FIELDS, _min_width=MIN_WINDOW_WIDTH,
+                 _error=_WINDOW_WIDTH_ERROR, _ValidationError=ValidationError) -> str:
+    wall_reference, position, width, height, sill_height, window_type, glass_type, ref_id = _fields(data)
+    if width < _min_width:
+        raise _ValidationError(_error)
+    return lisp_generator.insert_window(wall_reference, position, width, height, sill_height,
+                                        window_type, glass_type, ref_id)
+
+def build_door_simple(data: Dict[str, Any], _fields=_DOOR_SIMPLE_FIELDS, _min_width=MIN_DOOR_WIDTH,
+                      _error=_DOOR_WIDTH_ERROR, _ValidationError=ValidationError) -> str:
+    position, width, height, door_type, ref_id = _fields(data)
+    if width < _min_width:
+        raise _ValidationError(_error)
+    return lisp_generator.insert_door_simple(position, width, height, door_type, ref_id)
+
+def build_window_simple(data: Dict[str, Any], _fields=_WINDOW_SIMPLE_FIELDS, _min_width=MIN_WINDOW_WIDTH,
+                        _error=_WINDOW_WIDTH_ERROR, _ValidationError=ValidationError) -> str:
+    position, width, height, sill_height, window_type, ref_id = _fields(data)
+    if width < _min_width:
+        raise _ValidationError(_error)
+    return lisp_generator.insert_window_simple(position, width, height, sill_height, window_type, ref_id)
+
+def build_room(data: Dict[str, Any]) -> str:
+    points, height = _ROOM_FIELDS(data)
+    data['area'] = room_area(points)  # reported back by the room route
+    return lisp_generator.create_room(points, height)
+
+def build_grid(data: Dict[str, Any]) -> str:
+    return lisp_generator.setup_grid(*_GRID_FIELDS(data))
+
+@pure
+def build_layer(data: Dict[str, Any]) -> str:
+    return lisp_generator.create_layer(*_LAYER_FIELDS(data))
+
+def build_text(data: Dict[str, Any]) -> str:
+    return lisp_generator.add_text_note(*_TEXT_FIELDS(data))
+
+def build_dimension(data: Dict[str, Any]) -> str:
+    return lisp_generator.dimension_linear(*_DIMENSION_FIELDS(data))
+
+def build_furniture(data: Dict[str, Any]) -> str:
+    return lisp_generator.insert_furniture(*_FURNITURE_FIELDS(data))
+
+# Batch operation type -> (schema, LISP builder)
+BATCH_OPERATIONS = {
+    'wall': (WALL_SCHEMA, build_wall),
+    'door': (DOOR_SCHEMA, build_door),
+    'window': (WINDOW_SCHEMA, build_window),
+    'door_simple': (DOOR_SIMPLE_SCHEMA, build_door_simple),
+    'window_simple': (WINDOW_SIMPLE_SCHEMA, build_window_simple),
+    'room': (ROOM_SCHEMA, build_room),
+    'grid': (GRID_SCHEMA, build_grid),
+    'layer': (LAYER_SCHEMA, build_layer),
+    'text': (TEXT_SCHEMA, build_text),
+    'dimension': (DIMENSION_SCHEMA, build_dimension),
+    'furniture': (FURNITURE_SCHEMA, build_furniture)
+}
 
 # API Routes
 
-@app.route('/', methods=['GET'])
-def health_check():
-    """Health check endpoint"""
-    return jsonify({
+# Health responses are serialized only when the connection count changes
+_health_body = b""
+
+def update_health(connection_count: int):
+    """Rebuild the cached health check body"""
+    global _health_body
+    _health_body = orjson.dumps({
         "status": "healthy",
         "service": "AutoCAD MCP Server",
         "version": "1.0.0",
-        "connections": len(autocad_interface.connections)
+        "connections": connection_count
     })
 
+update_health(len(autocad_interface.connections))
+autocad_interface.on_change = update_health
+
+@app.route('/', methods=['GET'])
+def health_check():
+    """Health check endpoint"""
+    return app.response_class(_health_body, mimetype='application/json')
+
 @app.route('/api/autocad/connect', methods=['POST'])
 def connect_to_autocad():
     """Connect to AutoCAD instance"""
     try:
-        data = request.get_json() or {}
+        data = g.json or {}
         instance_id = data.get('instance_id', 'default')
         
         connection = autocad_interface.connect_to_autocad(instance_id)
@@ -104,7 +281,7 @@ def connect_to_autocad():
 def disconnect_from_autocad():
     """Disconnect from AutoCAD instance"""
     try:
-        data = request.get_json() or {}
+        data = g.json or {}
         instance_id = data.get('instance_id', 'default')
         
         success = autocad_interface.disconnect(instance_id)
@@ -132,358 +309,123 @@ def list_connections():
         logger.error(f"Failed to list connections: {str(e)}")
         return jsonify({"success": False, "error": str(e)}), 500
 
-# Core Drawing Elements
-
-@app.route('/api/drawing/wall', methods=['POST'])
-def create_wall():
-    """Create a wall"""
-    try:
-        data = request.get_json()
-        validate_request_data(data, ['start_point', 'end_point', 'thickness', 'height'])
-        
-        start_point = parse_point(data['start_point'])
-        end_point = parse_point(data['end_point'])
-        thickness = float(data['thickness'])
-        height = float(data['height'])
-        instance_id = data.get('instance_id', 'default')
-        
-        # Validation
-        if not validate_positive_number(thickness, 'thickness'):
-            raise ValidationError("Thickness must be positive")
-        if not validate_positive_number(height, 'height'):
-            raise ValidationError("Height must be positive")
-        
-        # Generate LISP code and execute
-        lisp_code = lisp_generator.create_wall(start_point, end_point, thickness, height)
-        result = autocad_interface.execute_lisp(lisp_code, instance_id)
-        
-        return jsonify({
-            "success": result.success,
-            "message": "Wall created successfully" if result.success else result.error_message,
-            "execution_time": result.execution_time
-        })
-        
-    except Exception as e:
-        logger.error(f"Failed to create wall: {str(e)}")
-        return jsonify({"success": False, "error": str(e)}), 400
-
-@app.route('/api/drawing/door', methods=['POST'])
-def insert_door():
-    """Insert a door with automatic annotation"""
-    try:
-        data = request.get_json()
-        validate_request_data(data, ['wall_reference', 'position', 'width', 'height', 'swing_direction'])
-        
-        wall_reference = data['wall_reference']
-        position = parse_point(data['position'])
-        width = float(data['width'])
-        height = float(data['height'])
-        swing_direction = SwingDirection(data['swing_direction'])
-        door_type = DoorType(data.get('door_type', 'SINGLE'))
-        wall_thickness = float(data.get('wall_thickness', 100.0))
-        ref_id = data.get('ref_id')
-        instance_id = data.get('instance_id', 'default')
-        
-        # Validation
-        if width < config.MIN_DOOR_WIDTH:
-            raise ValidationError(f"Door width must be at least {config.MIN_DOOR_WIDTH} inches")
-        
-        # Generate LISP code and execute
-        lisp_code = lisp_generator.insert_door(wall_reference, position, width, height,
-                                               swing_direction, door_type, wall_thickness, ref_id)
-        result = autocad_interface.execute_lisp(lisp_code, instance_id)
-        
-        return jsonify({
-            "success": result.success,
-            "message": "Door inserted successfully with annotation" if result.success else result.error_message,
-            "door_type": door_type.value,
-            "ref_id": ref_id if ref_id else "auto-generated",
-            "execution_time": result.execution_time
-        })
-        
-    except Exception as e:
-        logger.error(f"Failed to insert door: {str(e)}")
-        return jsonify({"success": False, "error": str(e)}), 400
-
-@app.route('/api/drawing/window', methods=['POST'])
-def insert_window():
-    """Insert a window with automatic annotation"""
-    try:
-        data = request.get_json()
-        validate_request_data(data, ['wall_reference', 'position', 'width', 'height', 'sill_height'])
-        
-        wall_reference = data['wall_reference']
-        position = parse_point(data['position'])
-        width = float(data['width'])
-        height = float(data['height'])
-        sill_height = float(data['sill_height'])
-        window_type = WindowType(data.get('window_type', 'FIXED'))
-        glass_type = GlassType(data.get('glass_type', 'DOUBLE'))
-        ref_id = data.get('ref_id')
-        instance_id = data.get('instance_id', 'default')
-        
-        # Validation
-        if width < config.MIN_WINDOW_WIDTH:
-            raise ValidationError(f"Window width must be at least {config.MIN_WINDOW_WIDTH} inches")
-        
-        # Generate LISP code and execute
-        lisp_code = lisp_generator.insert_window(wall_reference, position, width, height,
-                                                 sill_height, window_type, glass_type, ref_id)
-        result = autocad_interface.execute_lisp(lisp_code, instance_id)
-        
-        return jsonify({
-            "success": result.success,
-            "message": "Window inserted successfully with annotation" if result.success else result.error_message,
-            "window_type": window_type.value,
-            "glass_type": glass_type.value,
-            "ref_id": ref_id if ref_id else "auto-generated",
-            "execution_time": result.execution_time
-        })
-        
-    except Exception as e:
-        logger.error(f"Failed to insert window: {str(e)}")
-        return jsonify({"success": False, "error": str(e)}), 400
-
-@app.route('/api/drawing/door/simple', methods=['POST'])
-def insert_door_simple():
-    """Insert a door using simplified parameters"""
-    try:
-        data = request.get_json()
-        validate_request_data(data, ['position', 'width', 'height'])
-        
-        position = parse_point(data['position'])
-        width = float(data['width'])
-        height = float(data['height'])
-        door_type = DoorType(data.get('door_type', 'SINGLE'))
-        ref_id = data.get('ref_id')
-        instance_id = data.get('instance_id', 'default')
-        
-        # Validation
-        if width < config.MIN_DOOR_WIDTH:
-            raise ValidationError(f"Door width must be at least {config.MIN_DOOR_WIDTH} inches")
-        
-        # Generate LISP code and execute
-        lisp_code = lisp_generator.insert_door_simple(position, width, height, door_type, ref_id)
-        result = autocad_interface.execute_lisp(lisp_code, instance_id)
-        
-        return jsonify({
-            "success": result.success,
-            "message": f"{door_type.value} door inserted successfully" if result.success else result.error_message,
-            "door_type": door_type.value,
-            "execution_time": result.execution_time
-        })
-        
-    except Exception as e:
-        logger.error(f"Failed to insert simple door: {str(e)}")
-        return jsonify({"success": False, "error": str(e)}), 400
-
-@app.route('/api/drawing/window/simple', methods=['POST'])
-def insert_window_simple():
-    """Insert a window using simplified parameters"""
-    try:
-        data = request.get_json()
-        validate_request_data(data, ['position', 'width', 'height', 'sill_height'])
-        
-        position = parse_point(data['position'])
-        width = float(data['width'])
-        height = float(data['height'])
-        sill_height = float(data['sill_height'])
-        window_type = WindowType(data.get('window_type', 'FIXED'))
-        ref_id = data.get('ref_id')
-        instance_id = data.get('instance_id', 'default')
-        
-        # Validation
-        if width < config.MIN_WINDOW_WIDTH:
-            raise ValidationError(f"Window width must be at least {config.MIN_WINDOW_WIDTH} inches")
-        
-        # Generate LISP code and execute
-        lisp_code = lisp_generator.insert_window_simple(position, width, height, sill_height, window_type, ref_id)
-        result = autocad_interface.execute_lisp(lisp_code, instance_id)
-        
-        return jsonify({
-            "success": result.success,
-            "message": f"{window_type.value} window inserted successfully" if result.success else result.error_message,
-            "window_type": window_type.value,
-            "execution_time": result.execution_time
-        })
-        
-    except Exception as e:
-        logger.error(f"Failed to insert simple window: {str(e)}")
-        return jsonify({"success": False, "error": str(e)}), 400
-
-@app.route('/api/drawing/room', methods=['POST'])
-def create_room():
-    """Create a room"""
-    try:
-        data = request.get_json()
-        validate_request_data(data, ['points', 'height'])
-        
-        points = parse_points_list(data['points'])
-        height = float(data['height'])
-        instance_id = data.get('instance_id', 'default')
-        
-        # Validation
-        if len(points) < 3:
-            raise ValidationError("Room must have at least 3 points")
-        
-        area = calculate_area_from_points(points)
-        if area < config.MIN_ROOM_AREA:
-            raise ValidationError(f"Room area must be at least {config.MIN_ROOM_AREA} square feet")
-        
-        # Generate LISP code and execute
-        lisp_code = lisp_generator.create_room(points, height)
-        result = autocad_interface.execute_lisp(lisp_code, instance_id)
-        
-        return jsonify({
-            "success": result.success,
-            "message": "Room created successfully" if result.success else result.error_message,
-            "area": area,
-            "execution_time": result.execution_time
-        })
-        
-    except Exception as e:
-        logger.error(f"Failed to create room: {str(e)}")
-        return jsonify({"success": False, "error": str(e)}), 400
+# Drawing element views are generated from a single route table
 
-# Layout and Organization
+def door_details(data: Dict[str, Any]) -> Dict[str, Any]:
+    return {"door_type": data['door_type'].value, "ref_id": data['ref_id'] or "auto-generated"}
 
-@app.route('/api/layout/grid', methods=['POST'])
-def setup_grid():
-    """Setup drawing grid"""
-    try:
-        data = request.get_json()
-        validate_request_data(data, ['origin_point', 'x_spacing', 'y_spacing', 'x_count', 'y_count'])
-        
-        origin_point = parse_point(data['origin_point'])
-        x_spacing = float(data['x_spacing'])
-        y_spacing = float(data['y_spacing'])
-        x_count = int(data['x_count'])
-        y_count = int(data['y_count'])
-        instance_id = data.get('instance_id', 'default')
-        
-        # Generate LISP code and execute
-        lisp_code = lisp_generator.setup_grid(origin_point, x_spacing, y_spacing, x_count, y_count)
-        result = autocad_interface.execute_lisp(lisp_code, instance_id)
-        
-        return jsonify({
-            "success": result.success,
-            "message": "Grid setup completed" if result.success else result.error_message,
-            "execution_time": result.execution_time
-        })
-        
-    except Exception as e:
-        logger.error(f"Failed to setup grid: {str(e)}")
-        return jsonify({"success": False, "error": str(e)}), 400
+def window_details(data: Dict[str, Any]) -> Dict[str, Any]:
+    return {"window_type": data['window_type'].value, "glass_type": data['glass_type'].value,
+            "ref_id": data['ref_id'] or "auto-generated"}
 
-@app.route('/api/layout/layer', methods=['POST'])
-def create_layer():
-    """Create a new layer"""
-    try:
-        data = request.get_json()
-        validate_request_data(data, ['name', 'color', 'line_type', 'line_weight'])
-        
-        name = data['name']
-        color = int(data['color'])
-        line_type = data['line_type']
-        line_weight = float(data['line_weight'])
-        instance_id = data.get('instance_id', 'default')
-        
-        # Generate LISP code and execute
-        lisp_code = lisp_generator.create_layer(name, color, line_type, line_weight)
-        result = autocad_interface.execute_lisp(lisp_code, instance_id)
-        
-        return jsonify({
-            "success": result.success,
-            "message": f"Layer '{name}' created successfully" if result.success else result.error_message,
-            "execution_time": result.execution_time
-        })
-        
-    except Exception as e:
-        logger.error(f"Failed to create layer: {str(e)}")
-        return jsonify({"success": False, "error": str(e)}), 400
+def door_type_detail(data: Dict[str, Any]) -> Dict[str, Any]:
+    return {"door_type": data['door_type'].value}
 
-# Annotation and Dimensions
+def window_type_detail(data: Dict[str, Any]) -> Dict[str, Any]:
+    return {"window_type": data['window_type'].value}
 
-@app.route('/api/annotation/text', methods=['POST'])
-def add_text_note():
-    """Add text annotation"""
-    try:
-        data = request.get_json()
-        validate_request_data(data, ['insertion_point', 'text_string', 'height'])
-        
-        insertion_point = parse_point(data['insertion_point'])
-        text_string = data['text_string']
-        height = float(data['height'])
-        rotation = float(data.get('rotation', 0.0))
-        instance_id = data.get('instance_id', 'default')
-        
-        # Generate LISP code and execute
-        lisp_code = lisp_generator.add_text_note(insertion_point, text_string, height, rotation)
-        result = autocad_interface.execute_lisp(lisp_code, instance_id)
-        
-        return jsonify({
-            "success": result.success,
-            "message": "Text note added successfully" if result.success else result.error_message,
-            "execution_time": result.execution_time
-        })
-        
-    except Exception as e:
-        logger.error(f"Failed to add text note: {str(e)}")
-        return jsonify({"success": False, "error": str(e)}), 400
+def area_detail(data: Dict[str, Any]) -> Dict[str, Any]:
+    return {"area": data['area']}
 
-@app.route('/api/annotation/dimension', methods=['POST'])
-def dimension_linear():
-    """Add linear dimension"""
-    try:
-        data = request.get_json()
-        validate_request_data(data, ['start_point', 'end_point', 'offset_distance'])
-        
-        start_point = parse_point(data['start_point'])
-        end_point = parse_point(data['end_point'])
-        offset_distance = float(data['offset_distance'])
-        instance_id = data.get('instance_id', 'default')
-        
-        # Generate LISP code and execute
-        lisp_code = lisp_generator.dimension_linear(start_point, end_point, offset_distance)
-        result = autocad_interface.execute_lisp(lisp_code, instance_id)
-        
-        return jsonify({
-            "success": result.success,
-            "message": "Linear dimension added successfully" if result.success else result.error_message,
-            "execution_time": result.execution_time
-        })
-        
-    except Exception as e:
-        logger.error(f"Failed to add dimension: {str(e)}")
-        return jsonify({"success": False, "error": str(e)}), 400
+def make_drawing_view(operation: str, message: str, action: str,
+                      details: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None):
+    """Build a view that validates, generates and executes one drawing operation"""
+    schema, build = BATCH_OPERATIONS[operation]
+    cacheable = is_pure(build)
+    
+    def view():
+        try:
+            data = schema(g.json)
+            
+            # Validate, generate LISP code and execute
+            lisp_code = build(data)
+            result = run_lisp(lisp_code, data, cacheable, batchable=True)
+            
+            response = {
+                "success": result.success,
+                "message": message.format(**data) if result.success else result.error_message
+            }
+            if details is not None:
+                response.update(details(data))
+            response["execution_time"] = result.execution_time
+            return jsonify(response)
+            
+        except AutoCADConnectionError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to {action}: {str(e)}")
+            return jsonify({"success": False, "error": str(e)}), 400
+    
+    return view
+
+# (path, endpoint, operation, success message, logged action, extra response fields)
+DRAWING_ROUTES = (
+    # Core drawing elements
+    ('/api/drawing/wall', 'create_wall', 'wall',
+     "Wall created successfully", "create wall", None),
+    ('/api/drawing/door', 'insert_door', 'door',
+     "Door inserted successfully with annotation", "insert door", door_details),
+    ('/api/drawing/window', 'insert_window', 'window',
+     "Window inserted successfully with annotation", "insert window", window_details),
+    ('/api/drawing/door/simple', 'insert_door_simple', 'door_simple',
+     "{door_type.value} door inserted successfully", "insert simple door", door_type_detail),
+    ('/api/drawing/window/simple', 'insert_window_simple', 'window_simple',
+     "{window_type.value} window inserted successfully", "insert simple window", window_type_detail),
+    ('/api/drawing/room', 'create_room', 'room',
+     "Room created successfully", "create room", area_detail),
+    # Layout and organization
+    ('/api/layout/grid', 'setup_grid', 'grid',
+     "Grid setup completed", "setup grid", None),
+    ('/api/layout/layer', 'create_layer', 'layer',
+     "Layer '{name}' created successfully", "create layer", None),
+    # Annotation and dimensions
+    ('/api/annotation/text', 'add_text_note', 'text',
+     "Text note added successfully", "add text note", None),
+    ('/api/annotation/dimension', 'dimension_linear', 'dimension',
+     "Linear dimension added successfully", "add dimension", None),
+    # Furniture and fixtures
+    ('/api/furniture/insert', 'insert_furniture', 'furniture',
+     "Furniture inserted successfully", "insert furniture", None)
+)
 
-# Furniture and Fixtures
+for path, endpoint, operation, message, action, details in DRAWING_ROUTES:
+    app.add_url_rule(path, endpoint, make_drawing_view(operation, message, action, details),
+                     methods=['POST'])
 
-@app.route('/api/furniture/insert', methods=['POST'])
-def insert_furniture():
-    """Insert furniture"""
+@app.route('/api/drawing/batch', methods=['POST'])
+def draw_batch():
+    """Draw several elements with a single LISP execution"""
     try:
-        data = request.get_json()
-        validate_request_data(data, ['insertion_point', 'furniture_type'])
-        
-        insertion_point = parse_point(data['insertion_point'])
-        furniture_type = FurnitureType(data['furniture_type'])
-        rotation = float(data.get('rotation', 0.0))
-        scale = float(data.get('scale', 1.0))
-        instance_id = data.get('instance_id', 'default')
-        
-        # Generate LISP code and execute
-        lisp_code = lisp_generator.insert_furniture(insertion_point, furniture_type, rotation, scale)
-        result = autocad_interface.execute_lisp(lisp_code, instance_id)
+        data = BATCH_SCHEMA(g.json)
+        
+        operations = data['operations']
+        batch = lisp_generator.begin_batch()
+        for index, operation in enumerate(operations):
+            op_type = operation.get('type')
+            if not isinstance(op_type, str) or op_type not in BATCH_OPERATIONS:
+                raise ValidationError(f"Operation {index}: unknown type '{op_type}'")
+            
+            schema, build = BATCH_OPERATIONS[op_type]
+            try:
+                batch.add(build(schema(operation)))
+            except ValidationError as e:
+                raise ValidationError(f"Operation {index} ({op_type}): {str(e)}")
+        
+        # Execute every element as one AutoLISP form
+        lisp_code = "(progn\n" + batch.render() + "\n)"
+        result = run_lisp(lisp_code, data, batchable=True)
         
         return jsonify({
             "success": result.success,
-            "message": "Furniture inserted successfully" if result.success else result.error_message,
+            "message": f"{len(operations)} elements drawn successfully" if result.success else result.error_message,
+            "count": len(operations),
             "execution_time": result.execution_time
         })
         
+    except AutoCADConnectionError:
+        raise
     except Exception as e:
-        logger.error(f"Failed to insert furniture: {str(e)}")
+        logger.error(f"Failed to draw batch: {str(e)}")
         return jsonify({"success": False, "error": str(e)}), 400
 
 # Utilities and Calculations
@@ -492,10 +434,9 @@ def insert_furniture():
 def calculate_area():
     """Calculate area of polygon"""
     try:
-        data = request.get_json()
-        validate_request_data(data, ['points'])
+        data = AREA_SCHEMA(g.json)
         
-        points = parse_points_list(data['points'])
+        points = data['points']
         
         if len(points) < 3:
             raise ValidationError("Need at least 3 points to calculate area")
@@ -515,17 +456,37 @@ def calculate_area():
 
 # Server Management
 
+def lisp_result_events(lisp_code: str, data: Dict[str, Any]) -> Iterator[str]:
+    """Yield server-sent events announcing a LISP execution and then its result"""
+    yield "event: started\ndata: {}\n\n"
+    try:
+        result = run_lisp(lisp_code, data)
+        payload = {
+            "success": result.success,
+            "result": result.result,
+            "error_message": result.error_message,
+            "execution_time": result.execution_time
+        }
+        yield f"event: result\ndata: {orjson.dumps(payload, default=str).decode()}\n\n"
+    except Exception as e:
+        logger.error(f"Failed to execute LISP: {str(e)}")
+        yield f"event: error\ndata: {orjson.dumps({'success': False, 'error': str(e)}).decode()}\n\n"
+
 @app.route('/api/lisp/execute', methods=['POST'])
 def execute_lisp():
     """Execute custom AutoLISP code"""
     try:
-        data = request.get_json()
-        validate_request_data(data, ['lisp_code'])
+        data = LISP_SCHEMA(g.json)
         
         lisp_code = data['lisp_code']
-        instance_id = data.get('instance_id', 'default')
         
-        result = autocad_interface.execute_lisp(lisp_code, instance_id)
+        # Clients asking for an event stream get an immediate acknowledgement
+        if request.accept_mimetypes.best == 'text/event-stream':
+            return Response(stream_with_context(lisp_result_events(lisp_code, data)),
+                            mimetype='text/event-stream',
+                            headers={'Cache-Control': 'no-cache'})
+        
+        result = run_lisp(lisp_code, data)
         
         return jsonify({
             "success": result.success,
@@ -534,21 +495,32 @@ def execute_lisp():
             "execution_time": result.execution_time
         })
         
+    except AutoCADConnectionError:
+        raise
     except Exception as e:
         logger.error(f"Failed to execute LISP: {str(e)}")
         return jsonify({"success": False, "error": str(e)}), 400
 
+@app.route('/api/cache/clear', methods=['POST'])
+def clear_cache():
+    """Forget cached results of idempotent LISP executions"""
+    count = autocad_interface.clear_result_cache()
+    return jsonify({
+        "success": True,
+        "message": f"Cleared {count} cached LISP results",
+        "cleared": count
+    })
+
 @app.route('/api/drawing/save', methods=['POST'])
 def save_current_drawing():
     """Save current drawing"""
     try:
-        data = request.get_json()
-        validate_request_data(data, ['filepath'])
+        data = SAVE_SCHEMA(g.json)
         
         filepath = data['filepath']
-        instance_id = data.get('instance_id', 'default')
         
-        result = autocad_interface.save_current_drawing(filepath, instance_id)
+        with autocad_instance(data) as instance_id:
+            result = autocad_interface.save_current_drawing(filepath, instance_id)
         
         return jsonify({
             "success": result.success,
@@ -556,16 +528,24 @@ def save_current_drawing():
             "filepath": filepath
         })
         
+    except AutoCADConnectionError:
+        raise
     except Exception as e:
         logger.error(f"Failed to save drawing: {str(e)}")
         return jsonify({"success": False, "error": str(e)}), 400
 
 if __name__ == '__main__':
     logger.info("Starting AutoCAD MCP Server...")
-    logger.info(f"Configuration: {config.__class__.__name__}")
+    logger.info(f"Configuration: {config_class.__name__}")
+    autocad_pool.warm_in_background()
     
-    app.run(
-        host=config.HOST,
-        port=config.PORT,
-        debug=config.DEBUG
-    )
\ No newline at end of file
+    if config.DEBUG:
+        app.run(
+            host=config.HOST,
+            port=config.PORT,
+            debug=config.DEBUG
+        )
+    else:
+        # Multi-threaded WSGI server: requests are parsed and validated in parallel, COM work is serialized
+        from waitress import serve
+        serve(app, host=config.HOST, port=config.PORT, threads=config.SERVER_THREADS)
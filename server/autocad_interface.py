@@ -1,12 +1,19 @@
 """
 AutoCAD COM interface for connecting and executing commands
 """
+import hashlib
 import logging
+import queue
+import threading
 import time
 import os
-from typing import Optional, Dict, Any, List
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Callable, Optional, Dict, Any, FrozenSet, List, Tuple
 from server.models import AutoCADConnection, LispExecutionResult
-from server.utils import AutoCADConnectionError, timing_decorator
+from server.utils import (AutoCADConnectionError, AutoCADPoolTimeoutError, format_lisp_string,
+                          timing_decorator)
 
 # Try to import win32com and pythoncom, create mock if not available (for non-Windows systems)
 try:
@@ -41,40 +48,246 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Resolved once at import; the server runs from the repository root
+LISP_PATH = os.path.abspath("lisp")
+
+def _normalize_path(path: str) -> str:
+    """Normalize a filesystem path for case-insensitive, separator-agnostic comparison"""
+    return os.path.normcase(os.path.normpath(path.strip()))
+
+_LISP_PATH_KEY = _normalize_path(LISP_PATH)
+
+# Fixed commands and templates, built once
+_SET_LAYER_TEMPLATE = '(setvar "CLAYER" %s)'
+_ZOOM_EXTENTS_LISP = '(command "._ZOOM" "_E")'
+_REGEN_LISP = '(command "._REGEN")'
+
+@lru_cache(maxsize=256)
+def _set_layer_lisp(layer_name: str) -> str:
+    """LISP that makes `layer_name` current, with the name escaped"""
+    return _SET_LAYER_TEMPLATE % format_lisp_string(layer_name)
+
+def _wait_until(predicate: Callable[[], bool], timeout: float, interval: float = 0.05) -> bool:
+    """Poll `predicate` until it holds or `timeout` seconds pass, returning the last answer"""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(interval)
+    return True
+
+def _is_quiescent(app: Any) -> bool:
+    """Whether AutoCAD is idle and ready to accept commands"""
+    try:
+        return bool(app.GetAcadState().IsQuiescent)
+    except Exception:
+        return False
+
+class _LispJob:
+    """A queued LISP submission awaiting the worker"""
+    __slots__ = ('lisp_code', 'instance_id', 'batchable', 'future')
+    
+    def __init__(self, lisp_code: str, instance_id: str, batchable: bool = False):
+        self.lisp_code = lisp_code
+        self.instance_id = instance_id
+        # Only LISP the server generates may share a (progn ...) with other jobs
+        self.batchable = batchable
+        self.future: "Future[LispExecutionResult]" = Future()
+
+class AutoCADWorker(threading.Thread):
+    """Thread owning the single-threaded COM apartment every AutoCAD call runs in.
+
+    Callables and LISP submissions are queued; server-generated LISP that queues
+    up while the worker is busy is folded into one (progn ...) per AutoCAD application.
+    Other LISP (such as user code) always runs as its own job.
+    """
+    
+    def __init__(self, interface: "AutoCADInterface", batch_limit: int = 32):
+        super().__init__(name="autocad-com-worker", daemon=True)
+        self.interface = interface
+        self.batch_limit = batch_limit
+        self.tasks: "queue.Queue[Any]" = queue.Queue()
+        self._start_lock = threading.Lock()
+    
+    def _ensure_started(self):
+        if not self.is_alive():
+            with self._start_lock:
+                if not self.is_alive() and self.ident is None:
+                    self.start()
+    
+    def call(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run `fn(*args)` in the COM apartment and return its result"""
+        if threading.current_thread() is self:
+            return fn(*args)
+        self._ensure_started()
+        future: Future = Future()
+        self.tasks.put((fn, args, future))
+        return self._wait(future)
+    
+    def execute_lisp(self, lisp_code: str, instance_id: str, batchable: bool = False) -> LispExecutionResult:
+        """Send LISP through the worker, batching with other queued submissions if batchable"""
+        if threading.current_thread() is self:
+            return self.interface._execute_lisp(lisp_code, instance_id)
+        self._ensure_started()
+        job = _LispJob(lisp_code, instance_id, batchable)
+        self.tasks.put(job)
+        return self._wait(job.future)
+    
+    def _wait(self, future: Future) -> Any:
+        """Wait for queued work, giving up after the interface timeout"""
+        try:
+            return future.result(timeout=self.interface.timeout)
+        except FutureTimeoutError:
+            # Withdraw the work so it is not run after the caller was told it failed
+            if not future.cancel() and future.done():
+                return future.result()
+            raise AutoCADPoolTimeoutError(
+                f"AutoCAD did not respond within {self.interface.timeout} seconds")
+    
+    def stop(self):
+        """Ask the worker to finish queued work and release its apartment"""
+        if self.is_alive():
+            self.tasks.put(None)
+    
+    def run(self):
+        try:
+            self.interface._initialize_com()
+        except BaseException as e:
+            logger.error(f"COM worker could not start: {str(e)}")
+            self._fail_queued(e)
+            return
+        try:
+            while True:
+                pending = [self.tasks.get()]
+                while len(pending) < self.batch_limit:
+                    try:
+                        pending.append(self.tasks.get_nowait())
+                    except queue.Empty:
+                        break
+                
+                jobs: Dict[Any, List[_LispJob]] = defaultdict(list)
+                stopping = False
+                for task in pending:
+                    if task is None:
+                        stopping = True
+                    elif isinstance(task, _LispJob) and task.batchable:
+                        jobs[self._batch_key(task.instance_id)].append(task)
+                    else:
+                        # Keep FIFO order: LISP queued before this task goes out first
+                        self._flush_lisp(jobs)
+                        if isinstance(task, _LispJob):
+                            self._run_lisp(task.instance_id, [task])
+                        else:
+                            self._run_call(*task)
+                
+                self._flush_lisp(jobs)
+                if stopping:
+                    break
+        finally:
+            self.interface._uninitialize_com()
+    
+    def _fail_queued(self, error: BaseException):
+        """Fail every submission with `error` until stopped (used when COM is unavailable)"""
+        while (task := self.tasks.get()) is not None:
+            future = task.future if isinstance(task, _LispJob) else task[2]
+            if future.set_running_or_notify_cancel():
+                future.set_exception(error)
+    
+    def _run_call(self, fn: Callable[..., Any], args: Tuple[Any, ...], future: Future):
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+    
+    def _batch_key(self, instance_id: str) -> Any:
+        """Group LISP by AutoCAD application, so pooled connections to it share a batch"""
+        connection = self.interface.connections.get(instance_id)
+        if connection is None or connection.application is None:
+            return instance_id
+        return id(connection.application)
+    
+    def _flush_lisp(self, jobs: Dict[Any, List[_LispJob]]):
+        for batch in jobs.values():
+            self._run_lisp(batch[0].instance_id, batch)
+        jobs.clear()
+    
+    def _run_lisp(self, instance_id: str, batch: List[_LispJob]):
+        batch = [job for job in batch if job.future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+        if len(batch) == 1:
+            lisp_code = batch[0].lisp_code
+        else:
+            lisp_code = "(progn\n" + "\n".join(job.lisp_code.strip() for job in batch) + "\n)"
+            logger.debug(f"Batched {len(batch)} LISP submissions for {instance_id}")
+        try:
+            result = self.interface._execute_lisp(lisp_code, instance_id)
+        except Exception as e:
+            result = LispExecutionResult(success=False,
+                                         error_message=f"Failed to execute LISP code: {str(e)}")
+        for job in batch:
+            job.future.set_result(result)
+
 class AutoCADInterface:
     """Interface for connecting to and communicating with AutoCAD"""
     
-    def __init__(self, application_name: str = "AutoCAD.Application", timeout: int = 30):
+    LISP_BATCH_LIMIT = 32  # most queued snippets folded into one SendCommand
+    ALIVE_CHECK_TTL = 2.0  # seconds a successful liveness probe is trusted
+    STARTUP_TIMEOUT = 5.0  # seconds to wait for a new drawing or a LISP load to settle
+    
+    def __init__(self, application_name: str = "AutoCAD.Application", timeout: int = 30,
+                 result_cache_size: int = 512):
         self.application_name = application_name
         self.timeout = timeout
         self.connections: Dict[str, AutoCADConnection] = {}
+        self._connections_lock = threading.Lock()  # request threads add and remove entries
         self.logger = logging.getLogger(__name__)
-        self._com_initialized = False
+        # CoInitialize is per thread, so its state is tracked per thread too
+        self._com_tls = threading.local()
+        self._result_cache: "OrderedDict[Tuple[str, bytes], LispExecutionResult]" = OrderedDict()
+        self._result_cache_size = result_cache_size
+        self._result_cache_lock = threading.Lock()
+        self._result_generation = 0  # bumped whenever LISP is sent, so late results are not cached
+        # Called with the new connection count whenever a connection is added or dropped
+        self.on_change: Optional[Callable[[int], None]] = None
+        # All COM traffic runs on one worker thread, started on first use
+        self._worker = AutoCADWorker(self, self.LISP_BATCH_LIMIT)
+    
+    def shutdown(self):
+        """Stop the COM worker once it has drained queued work"""
+        self._worker.stop()
+    
+    def _connections_changed(self):
+        """Notify the on_change listener of the current connection count"""
+        if self.on_change is not None:
+            self.on_change(len(self.connections))
     
     def _initialize_com(self):
-        """Initialize COM library if not already initialized"""
+        """Initialize COM on the calling thread, once per thread"""
+        if getattr(self._com_tls, 'initialized', False):
+            return
         if WIN32COM_AVAILABLE:
             try:
-                pythoncom.CoInitialize()
-                self._com_initialized = True
-                self.logger.debug("COM library initialized successfully")
+                pythoncom.CoInitializeEx(pythoncom.COINIT_APARTMENTTHREADED)
+                self.logger.debug(f"COM library initialized on {threading.current_thread().name}")
             except Exception as e:
                 self.logger.warning(f"COM initialization failed: {str(e)}")
                 raise AutoCADConnectionError(f"Failed to initialize COM library: {str(e)}")
-        else:
-            self._com_initialized = True
+        self._com_tls.initialized = True
     
     def _uninitialize_com(self):
-        """Uninitialize COM library if it was initialized by this instance"""
-        if self._com_initialized and WIN32COM_AVAILABLE:
+        """Uninitialize COM on the calling thread if this instance initialized it there"""
+        if not getattr(self._com_tls, 'initialized', False):
+            return
+        self._com_tls.initialized = False
+        if WIN32COM_AVAILABLE:
             try:
                 pythoncom.CoUninitialize()
-                self._com_initialized = False
                 self.logger.debug("COM library uninitialized")
             except Exception as e:
                 self.logger.warning(f"COM cleanup failed: {str(e)}")
-        elif self._com_initialized:
-            self._com_initialized = False
 
     def _get_active_document(self, app: Any) -> Any:
         """Get the active document, creating one if none exists."""
@@ -84,7 +297,26 @@ class AutoCADInterface:
         except Exception:
             self.logger.info("No active document, creating new drawing.")
             doc = app.Documents.Add()
-            time.sleep(2)
+            if not _wait_until(lambda: _is_quiescent(app), self.STARTUP_TIMEOUT):
+                self.logger.warning("New drawing did not become ready in time")
+        return doc
+
+    def _ensure_document(self, connection: AutoCADConnection) -> Any:
+        """Return the connection's cached document, re-resolving it only if it went away"""
+        doc = connection.document
+        if doc is not None:
+            try:
+                _ = doc.Name
+                return doc
+            except Exception:
+                self.logger.info(f"Cached document for {connection.instance_id} is gone, re-resolving")
+        
+        doc = self._get_active_document(connection.application)
+        connection.document = doc
+        try:
+            connection.model_space = doc.ModelSpace
+        except Exception:
+            connection.model_space = None
         return doc
 
     @timing_decorator
@@ -92,39 +324,74 @@ class AutoCADInterface:
         """
         Connect to AutoCAD application
         """
+        return self._worker.call(self._connect_to_autocad, instance_id)
+    
+    def _register_lisp_path(self, app: Any) -> FrozenSet[str]:
+        """Make sure the lisp/ directory is on AutoCAD's support path, returning the entries"""
+        preferences = app.Preferences
+        support_path = preferences.Files.SupportPath
+        entries = frozenset(_normalize_path(entry) for entry in support_path.split(';') if entry.strip())
+        
+        if _LISP_PATH_KEY not in entries:
+            self.logger.info(f"Adding LISP path to AutoCAD support paths: {LISP_PATH}")
+            preferences.Files.SupportPath = f"{support_path};{LISP_PATH}"
+            entries |= {_LISP_PATH_KEY}
+        else:
+            self.logger.debug(f"LISP path already in AutoCAD support paths: {LISP_PATH}")
+        return entries
+    
+    def _live_connection(self) -> Optional[AutoCADConnection]:
+        """Return an existing connection whose AutoCAD still answers, if any.
+
+        New connections reuse its application object, so pooled connections
+        share one application and the worker can batch their LISP together.
+        """
+        now = time.monotonic()
+        for connection in list(self.connections.values()):
+            if self._probe_connection(connection, now):
+                return connection
+        return None
+    
+    def _attach_application(self) -> Any:
+        """Attach to the running AutoCAD, starting it if none is running"""
+        try:
+            app = win32com.client.GetActiveObject(self.application_name)
+            self.logger.info("Connected to existing AutoCAD instance")
+        except:
+            self.logger.info("Starting new AutoCAD instance")
+            app = win32com.client.Dispatch(self.application_name)
+            app.Visible = True
+            if not _wait_until(lambda: _is_quiescent(app), self.timeout):
+                self.logger.warning("AutoCAD did not become ready in time")
+        return app
+    
+    def _connect_to_autocad(self, instance_id: str) -> AutoCADConnection:
+        """Connect to AutoCAD from inside the COM worker"""
         try:
             self.logger.info(f"Attempting to connect to AutoCAD (instance: {instance_id})")
             
             self._initialize_com()
             
-            try:
-                app = win32com.client.GetActiveObject(self.application_name)
-                self.logger.info("Connected to existing AutoCAD instance")
-            except:
-                self.logger.info("Starting new AutoCAD instance")
-                app = win32com.client.Dispatch(self.application_name)
-                app.Visible = True
-                time.sleep(2)
-            
-            lisp_path = os.path.abspath("lisp")
-            preferences = app.Preferences
-            support_path = preferences.Files.SupportPath
-
-            if lisp_path not in support_path:
-                self.logger.info(f"Adding LISP path to AutoCAD support paths: {lisp_path}")
-                preferences.Files.SupportPath = f"{support_path};{lisp_path}"
+            live = self._live_connection()
+            if live is not None:
+                self.logger.info("Reusing the AutoCAD application of an existing connection")
+                app, support_paths = live.application, live.support_paths
             else:
-                self.logger.debug(f"LISP path already in AutoCAD support paths: {lisp_path}")
+                # A newly attached (or restarted) AutoCAD gets its SupportPath checked
+                app = self._attach_application()
+                support_paths = self._register_lisp_path(app)
 
-            self._get_active_document(app)
-            
             connection = AutoCADConnection(
                 instance_id=instance_id,
                 application=app,
-                connected=True
+                connected=True,
+                support_paths=support_paths
             )
+            self._ensure_document(connection)
             
-            self.connections[instance_id] = connection
+            with self._connections_lock:
+                self.connections[instance_id] = connection
+            self._connections_changed()
             self.logger.info(f"Successfully connected to AutoCAD (instance: {instance_id})")
             
             return connection
@@ -139,25 +406,79 @@ class AutoCADInterface:
         connection = self.connections.get(instance_id)
         if connection and not self.is_connection_alive(connection):
             self.logger.warning(f"Connection {instance_id} is no longer alive, removing")
-            del self.connections[instance_id]
+            with self._connections_lock:
+                if self.connections.get(instance_id) is connection:
+                    del self.connections[instance_id]
+            self._connections_changed()
             return None
         return connection
     
     def is_connection_alive(self, connection: AutoCADConnection) -> bool:
-        """Check if AutoCAD connection is still alive"""
+        """Check if AutoCAD connection is still alive, probing COM at most once per TTL"""
+        now = time.monotonic()
+        if now - connection.last_alive_check < self.ALIVE_CHECK_TTL:
+            return True
+        return self._worker.call(self._probe_connection, connection, now)
+    
+    def _probe_connection(self, connection: AutoCADConnection, now: float) -> bool:
+        """Read the application name over COM to confirm AutoCAD still answers"""
         try:
             if connection.application is None:
                 return False
             _ = connection.application.Name
+            connection.last_alive_check = now
             return True
         except:
             return False
     
     @timing_decorator
-    def execute_lisp(self, lisp_code: str, instance_id: str = "default") -> LispExecutionResult:
+    def execute_lisp(self, lisp_code: str, instance_id: str = "default",
+                     cacheable: bool = False, batchable: bool = False) -> LispExecutionResult:
         """
         Execute AutoLISP code in AutoCAD
+        
+        When `cacheable` is set the code must be idempotent: a successful result is
+        remembered and identical code on the same instance is not sent again until
+        other LISP runs. `batchable` marks server-generated code that may share one
+        SendCommand with other queued submissions; leave it unset for user-supplied LISP.
         """
+        key = None
+        if cacheable:
+            key = (instance_id, hashlib.blake2b(lisp_code.encode(), digest_size=16).digest())
+        with self._result_cache_lock:
+            if key is not None:
+                cached = self._result_cache.get(key)
+                if cached is not None:
+                    self._result_cache.move_to_end(key)
+                    return cached
+            # Any LISP that reaches AutoCAD may undo what a cached result reported
+            # (pooled instances share one drawing, so drop every entry)
+            self._result_cache.clear()
+            self._result_generation += 1
+            generation = self._result_generation
+        
+        result = self._submit_lisp(lisp_code, instance_id, batchable)
+        if key is not None and result.success:
+            with self._result_cache_lock:
+                if generation == self._result_generation:
+                    self._result_cache[key] = result
+                    if len(self._result_cache) > self._result_cache_size:
+                        self._result_cache.popitem(last=False)
+        return result
+    
+    def clear_result_cache(self) -> int:
+        """Forget all cached LISP results, returning how many were dropped"""
+        with self._result_cache_lock:
+            count = len(self._result_cache)
+            self._result_cache.clear()
+        return count
+    
+    def _submit_lisp(self, lisp_code: str, instance_id: str, batchable: bool = False) -> LispExecutionResult:
+        """Queue LISP code for the COM worker and wait for its result"""
+        return self._worker.execute_lisp(lisp_code, instance_id, batchable)
+    
+    def _execute_lisp(self, lisp_code: str, instance_id: str) -> LispExecutionResult:
+        """Send AutoLISP code to AutoCAD"""
         start_time = time.time()
         
         try:
@@ -172,7 +493,7 @@ class AutoCADInterface:
             
             self.logger.debug(f"Executing LISP code: {lisp_code[:100]}...")
             
-            doc = self._get_active_document(connection.application)
+            doc = self._ensure_document(connection)
             
             # First, ensure LISP support files are loaded
             self._ensure_lisp_files_loaded(doc, instance_id)
@@ -197,6 +518,10 @@ class AutoCADInterface:
         except Exception as e:
             execution_time = time.time() - start_time
             error_msg = f"Failed to execute LISP code: {str(e)}"
+            # Make the next liveness check probe AutoCAD instead of trusting the TTL
+            connection = self.connections.get(instance_id)
+            if connection is not None:
+                connection.last_alive_check = 0.0
             self.logger.error(error_msg)
             
             return LispExecutionResult(
@@ -218,18 +543,18 @@ class AutoCADInterface:
         if not connection._lisp_files_loaded:
             try:
                 # Load core functions
-                core_lisp_path = os.path.abspath("lisp/core_functions.lsp")
-                arch_lisp_path = os.path.abspath("lisp/architectural_tools.lsp")
+                core_lisp_path = os.path.join(LISP_PATH, "core_functions.lsp")
+                arch_lisp_path = os.path.join(LISP_PATH, "architectural_tools.lsp")
                 
                 if os.path.exists(core_lisp_path):
                     self.logger.info(f"Loading core functions from {core_lisp_path}")
                     doc.SendCommand(f'(load "{core_lisp_path.replace(chr(92), "/")}") ')
-                    time.sleep(0.5)
+                    _wait_until(lambda: _is_quiescent(connection.application), self.STARTUP_TIMEOUT)
                 
                 if os.path.exists(arch_lisp_path):
                     self.logger.info(f"Loading architectural tools from {arch_lisp_path}")
                     doc.SendCommand(f'(load "{arch_lisp_path.replace(chr(92), "/")}") ')
-                    time.sleep(0.5)
+                    _wait_until(lambda: _is_quiescent(connection.application), self.STARTUP_TIMEOUT)
                 
                 connection._lisp_files_loaded = True
                 self.logger.info("LISP support files loaded successfully")
@@ -241,16 +566,17 @@ class AutoCADInterface:
         Load AutoLISP file in AutoCAD
         """
         try:
-            with open(filepath, 'r') as f:
-                lisp_code = f.read()
+            if not os.path.exists(filepath):
+                error_msg = f"LISP file not found: {filepath}"
+                self.logger.error(error_msg)
+                return LispExecutionResult(success=False, error_message=error_msg)
             
-            self.logger.info(f"Loading LISP file: {filepath}")
-            return self.execute_lisp(lisp_code, instance_id)
+            # Let AutoCAD's own loader read the file rather than marshalling its text over COM
+            load_path = os.path.abspath(filepath).replace(chr(92), "/")
+            self.logger.info(f"Loading LISP file: {load_path}")
+            return self.execute_lisp(f"(load {format_lisp_string(load_path)})", instance_id,
+                                     batchable=True)
             
-        except FileNotFoundError:
-            error_msg = f"LISP file not found: {filepath}"
-            self.logger.error(error_msg)
-            return LispExecutionResult(success=False, error_message=error_msg)
         except Exception as e:
             error_msg = f"Failed to load LISP file: {str(e)}"
             self.logger.error(error_msg)
@@ -260,6 +586,10 @@ class AutoCADInterface:
         """
         Save current AutoCAD drawing
         """
+        return self._worker.call(self._save_current_drawing, filepath, instance_id)
+    
+    def _save_current_drawing(self, filepath: str, instance_id: str) -> LispExecutionResult:
+        """Save the drawing from inside the COM worker"""
         try:
             self._initialize_com()
             
@@ -272,8 +602,9 @@ class AutoCADInterface:
             
             self.logger.info(f"Saving drawing to: {filepath}")
             
-            doc = self._get_active_document(connection.application)
+            doc = self._ensure_document(connection)
             doc.SaveAs(filepath)
+            self.clear_result_cache()
             
             return LispExecutionResult(success=True, result=f"Drawing saved to {filepath}")
             
@@ -284,12 +615,16 @@ class AutoCADInterface:
     
     def get_active_document_info(self, instance_id: str = "default") -> Dict[str, Any]:
         """Get information about the active AutoCAD document"""
+        return self._worker.call(self._get_active_document_info, instance_id)
+    
+    def _get_active_document_info(self, instance_id: str) -> Dict[str, Any]:
+        """Read document properties from inside the COM worker"""
         try:
             connection = self.get_connection(instance_id)
             if not connection:
                 return {"error": "No active AutoCAD connection"}
             
-            doc = self._get_active_document(connection.application)
+            doc = self._ensure_document(connection)
             
             return {
                 "name": doc.Name,
@@ -305,29 +640,30 @@ class AutoCADInterface:
     
     def set_current_layer(self, layer_name: str, instance_id: str = "default") -> LispExecutionResult:
         """Set the current active layer in AutoCAD"""
-        lisp_code = f'(setvar "CLAYER" "{layer_name}")'
-        return self.execute_lisp(lisp_code, instance_id)
+        return self.execute_lisp(_set_layer_lisp(layer_name), instance_id, batchable=True)
     
     def zoom_extents(self, instance_id: str = "default") -> LispExecutionResult:
         """Zoom to drawing extents"""
-        lisp_code = '(command "._ZOOM" "_E")'
-        return self.execute_lisp(lisp_code, instance_id)
+        return self.execute_lisp(_ZOOM_EXTENTS_LISP, instance_id, batchable=True)
     
     def regenerate_drawing(self, instance_id: str = "default") -> LispExecutionResult:
         """Regenerate the drawing"""
-        lisp_code = '(command "._REGEN")'
-        return self.execute_lisp(lisp_code, instance_id)
+        return self.execute_lisp(_REGEN_LISP, instance_id, batchable=True)
     
     def disconnect(self, instance_id: str = "default") -> bool:
         """
         Disconnect from AutoCAD instance
         """
         try:
-            if instance_id in self.connections:
-                del self.connections[instance_id]
+            with self._connections_lock:
+                connection = self.connections.pop(instance_id, None)
+                remaining = len(self.connections)
+            if connection is not None:
+                self._connections_changed()
+                self.clear_result_cache()
                 self.logger.info(f"Disconnected from AutoCAD instance: {instance_id}")
                 
-                if not self.connections:
+                if not remaining:
                     self._uninitialize_com()
                 
                 return True
@@ -350,18 +686,31 @@ class AutoCADInterface:
     
     def list_connections(self) -> List[Dict[str, Any]]:
         """List all active AutoCAD connections"""
+        return self._worker.call(self._list_connections)
+    
+    def _snapshot(self, connection: AutoCADConnection) -> Optional[Dict[str, Any]]:
+        """Read a connection's document state in one pass; None means AutoCAD is gone"""
+        try:
+            doc = connection.document
+            name, path, saved, read_only = doc.Name, doc.FullName, doc.Saved, doc.ReadOnly
+        except Exception:
+            # A closed or switched document is not a dead connection; re-resolve before giving up
+            try:
+                doc = self._ensure_document(connection)
+                name, path, saved, read_only = doc.Name, doc.FullName, doc.Saved, doc.ReadOnly
+            except Exception:
+                return None
+        connection.last_alive_check = time.monotonic()
+        return {"name": name, "path": path or "Untitled", "saved": saved, "read_only": read_only}
+    
+    def _list_connections(self) -> List[Dict[str, Any]]:
+        """Describe each connection from inside the COM worker"""
         connections = []
-        for instance_id, conn in self.connections.items():
-            info = {
+        for instance_id, conn in list(self.connections.items()):
+            snapshot = self._snapshot(conn)
+            connections.append({
                 "instance_id": instance_id,
-                "connected": self.is_connection_alive(conn),
-                "document_name": "Unknown"
-            }
-            if info["connected"]:
-                try:
-                    doc_info = self.get_active_document_info(instance_id)
-                    info["document_name"] = doc_info.get("name", "Unknown")
-                except Exception as e:
-                    self.logger.warning(f"Could not get doc info for {instance_id}: {e}")
-            connections.append(info)
+                "connected": snapshot is not None,
+                "document_name": snapshot["name"] if snapshot else "Unknown"
+            })
         return connections
\ No newline at end of file
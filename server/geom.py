@@ -0,0 +1,33 @@
+"""
+NumPy geometry helpers for point-heavy requests
+"""
+from typing import Any, Dict, List
+import numpy as np
+from server._kernels import NUMBA_AVAILABLE, NUMBA_MIN_POINTS
+
+if NUMBA_AVAILABLE:
+    from server._kernels import shoelace_area
+
+def points_array(points_data: List[Dict[str, Any]]) -> np.ndarray:
+    """Parse a list of point dicts into an (N, 3) float64 array"""
+    coords = np.array(
+        [[point_data.get('x', 0), point_data.get('y', 0), point_data.get('z', 0)]
+         for point_data in points_data],
+        dtype=np.float64
+    ).reshape(-1, 3)
+    if not np.isfinite(coords).all():
+        raise ValueError("point coordinates must be finite numbers")
+    return coords
+
+def polygon_area(coords: np.ndarray) -> float:
+    """Shoelace area of the polygon whose vertices are the rows of `coords`"""
+    if NUMBA_AVAILABLE and len(coords) >= NUMBA_MIN_POINTS:
+        return shoelace_area(np.ascontiguousarray(coords, dtype=np.float64))
+    x = coords[:, 0]
+    y = coords[:, 1]
+    return abs(float(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))) / 2.0
+
+def distances_batch(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Euclidean distances between matching rows of two (N, 3) point arrays"""
+    d = a - b
+    return np.sqrt(np.einsum('ij,ij->i', d, d))
@@ -2,55 +2,27 @@
 AutoLISP code generation for architectural functions
 """
 import logging
-from typing import List, Dict, Any, Optional
+from functools import lru_cache, wraps
+from typing import List, Dict, Any, Optional, Sequence, Tuple, Union
+import numpy as np
 from server.models import (Point, Wall, Door, Window, Room, Layer, TextNote, Dimension,
                            Furniture, FurnitureType, SwingDirection, DoorType, WindowType, GlassType)
-from server.utils import format_lisp_string, format_lisp_point, format_lisp_point_list, sanitize_layer_name
+from server.utils import (PointLike, point_coords, format_lisp_string, format_lisp_point,
+                          format_lisp_point_list, sanitize_layer_name)
+from server.geom import polygon_area
 
 logger = logging.getLogger(__name__)
 
-class LispGenerator:
-    """Generates AutoLISP code for architectural functions"""
-    
-    def __init__(self):
-        self.logger = logging.getLogger(__name__)
-    
-    def create_wall(self, start_point: Point, end_point: Point, thickness: float, height: float) -> str:
-        """Generate AutoLISP code to create a wall"""
-        return f"""(create-architectural-wall {format_lisp_point(start_point)} {format_lisp_point(end_point)} {thickness} {height})"""
+LISP_CACHE_SIZE = 4096  # generated LISP strings kept per generator method
 
-    def insert_door(self, wall_reference: str, position: Point, width: float, height: float,
-                    swing_direction: SwingDirection, door_type: DoorType = DoorType.SINGLE,
-                    wall_thickness: float = 100.0, ref_id: str = None) -> str:
-        """Generate AutoLISP code to insert a door with automatic annotation"""
-        swing_angle = {
-            SwingDirection.LEFT_IN: 0,
-            SwingDirection.LEFT_OUT: 180,
-            SwingDirection.RIGHT_IN: 90,
-            SwingDirection.RIGHT_OUT: 270
-        }.get(swing_direction, 90)
-        
-        ref_id_param = f'"{ref_id}"' if ref_id else 'nil'
-        
-        return f"""(c:create-door {position.x} {position.y} {width} {height} {wall_thickness} {swing_angle} "{door_type.value}" {ref_id_param})"""
-
-    def insert_window(self, wall_reference: str, position: Point, width: float, height: float,
-                     sill_height: float, window_type: WindowType = WindowType.FIXED,
-                     glass_type: GlassType = GlassType.DOUBLE, ref_id: str = None) -> str:
-        """Generate AutoLISP code to insert a window with automatic annotation"""
-        ref_id_param = f'"{ref_id}"' if ref_id else 'nil'
-        
-        return f"""(c:create-window {position.x} {position.y} {width} {height} {sill_height} "{window_type.value}" "{glass_type.value}" {ref_id_param})"""
-
-    def create_room(self, points: List[Point], height: float) -> str:
-        """Generate AutoLISP code to create a room"""
-        points_lisp = format_lisp_point_list(points)
-        
-        return f"""
+# Templates are built once at import; generators only substitute values
+_WALL_TEMPLATE = "(create-architectural-wall '(%s %s %s) '(%s %s %s) %s %s)"
+_DOOR_TEMPLATE = '(c:create-door %s %s %s %s %s %s "%s" %s)'
+_WINDOW_TEMPLATE = '(c:create-window %s %s %s %s %s "%s" "%s" %s)'
+_DOOR_SIMPLE_TEMPLATE = "(%s %s %s %s %s %s)"
+_WINDOW_SIMPLE_TEMPLATE = "(%s %s %s %s %s %s %s)"
+_ROOM_DEFUN = """
 (defun create-room (points height)
-  (setq points {points_lisp})
-  (setq height {height})
-  
   ; Create polyline for room boundary
   (command "._PLINE")
   (foreach pt points
@@ -60,19 +32,12 @@ class LispGenerator:
   
   (princ "Room created successfully")
 )
-(create-room {points_lisp} {height})
 """
+_ROOM_CALL = "(create-room %(points)s %(height)s)\n"
+_ROOM_TEMPLATE = _ROOM_DEFUN + _ROOM_CALL
 
-    def setup_grid(self, origin_point: Point, x_spacing: float, y_spacing: float, x_count: int, y_count: int) -> str:
-        """Generate AutoLISP code to setup a drawing grid"""
-        return f"""
+_GRID_DEFUN = """
 (defun setup-grid (origin x-spacing y-spacing x-count y-count)
-  (setq origin {format_lisp_point(origin_point)})
-  (setq x-spacing {x_spacing})
-  (setq y-spacing {y_spacing})
-  (setq x-count {x_count})
-  (setq y-count {y_count})
-  
   ; Set grid and snap settings
   (setvar "GRIDMODE" 1)
   (setvar "SNAPMODE" 1)
@@ -102,53 +67,34 @@ class LispGenerator:
   
   (princ "Grid setup completed")
 )
-(setup-grid {format_lisp_point(origin_point)} {x_spacing} {y_spacing} {x_count} {y_count})
 """
+_GRID_CALL = "(setup-grid %(origin)s %(x_spacing)s %(y_spacing)s %(x_count)s %(y_count)s)\n"
+_GRID_TEMPLATE = _GRID_DEFUN + _GRID_CALL
 
-    def create_layer(self, name: str, color: int, line_type: str, line_weight: float) -> str:
-        """Generate AutoLISP code to create a layer"""
-        safe_name = sanitize_layer_name(name)
-        
-        return f"""
+_LAYER_DEFUN = """
 (defun create-layer (name color linetype lineweight)
-  (setq name {format_lisp_string(safe_name)})
-  (setq color {color})
-  (setq linetype {format_lisp_string(line_type)})
-  (setq lineweight {line_weight})
-  
   ; Create new layer
   (command "._LAYER" "N" name "C" color name "LT" linetype name "LW" lineweight name "")
   
   (princ (strcat "Layer " name " created successfully"))
 )
-(create-layer {format_lisp_string(safe_name)} {color} {format_lisp_string(line_type)} {line_weight})
 """
+_LAYER_CALL = "(create-layer %(name)s %(color)s %(line_type)s %(line_weight)s)\n"
+_LAYER_TEMPLATE = _LAYER_DEFUN + _LAYER_CALL
 
-    def add_text_note(self, insertion_point: Point, text_string: str, height: float, rotation: float = 0.0) -> str:
-        """Generate AutoLISP code to add text annotation"""
-        return f"""
+_TEXT_DEFUN = """
 (defun add-text-note (pos text height rotation)
-  (setq pos {format_lisp_point(insertion_point)})
-  (setq text {format_lisp_string(text_string)})
-  (setq height {height})
-  (setq rotation {rotation})
-  
   ; Create text entity
   (command "._TEXT" pos height rotation text)
   
   (princ "Text note added successfully")
 )
-(add-text-note {format_lisp_point(insertion_point)} {format_lisp_string(text_string)} {height} {rotation})
 """
+_TEXT_CALL = "(add-text-note %(pos)s %(text)s %(height)s %(rotation)s)\n"
+_TEXT_TEMPLATE = _TEXT_DEFUN + _TEXT_CALL
 
-    def dimension_linear(self, start_point: Point, end_point: Point, offset_distance: float) -> str:
-        """Generate AutoLISP code to add linear dimension"""
-        return f"""
+_DIMENSION_DEFUN = """
 (defun dimension-linear (start-pt end-pt offset)
-  (setq start-pt {format_lisp_point(start_point)})
-  (setq end-pt {format_lisp_point(end_point)})
-  (setq offset {offset_distance})
-  
   ; Calculate dimension line position
   (setq dim-line-pt (polar start-pt (+ (angle start-pt end-pt) (/ pi 2)) offset))
   
@@ -157,110 +103,271 @@ class LispGenerator:
   
   (princ "Linear dimension added successfully")
 )
-(dimension-linear {format_lisp_point(start_point)} {format_lisp_point(end_point)} {offset_distance})
 """
+_DIMENSION_CALL = "(dimension-linear %(start)s %(end)s %(offset)s)\n"
+_DIMENSION_TEMPLATE = _DIMENSION_DEFUN + _DIMENSION_CALL
 
-    def insert_furniture(self, insertion_point: Point, furniture_type: FurnitureType, rotation: float, scale: float) -> str:
-        """Generate AutoLISP code to insert furniture"""
-        # Define furniture blocks (simplified representations)
-        furniture_blocks = {
-            FurnitureType.CHAIR: "CHAIR_BLOCK",
-            FurnitureType.TABLE: "TABLE_BLOCK", 
-            FurnitureType.BED: "BED_BLOCK",
-            FurnitureType.SOFA: "SOFA_BLOCK",
-            FurnitureType.DESK: "DESK_BLOCK"
-        }
-        
-        block_name = furniture_blocks.get(furniture_type, "GENERIC_FURNITURE")
-        
-        return f"""
+_FURNITURE_DEFUN = """
 (defun insert-furniture (pos block-name rotation scale)
-  (setq pos {format_lisp_point(insertion_point)})
-  (setq block-name {format_lisp_string(block_name)})
-  (setq rotation {rotation})
-  (setq scale {scale})
-  
   ; Insert furniture block
   (command "._INSERT" block-name pos scale scale rotation)
   
   (princ (strcat "Furniture " block-name " inserted successfully"))
 )
-(insert-furniture {format_lisp_point(insertion_point)} {format_lisp_string(block_name)} {rotation} {scale})
 """
+_FURNITURE_CALL = "(insert-furniture %(pos)s %(block_name)s %(rotation)s %(scale)s)\n"
+_FURNITURE_TEMPLATE = _FURNITURE_DEFUN + _FURNITURE_CALL
 
-    def calculate_area(self, points: List[Point]) -> str:
-        """Generate AutoLISP code to calculate area"""
-        points_lisp = format_lisp_point_list(points)
-        
-        return f"""
+_AREA_DEFUN = """
 (defun calculate-area (points)
-  (setq points {points_lisp})
   (setq area 0.0)
-  (setq n (length points))
   
-  ; Shoelace formula for polygon area
-  (setq i 0)
-  (repeat n
-    (setq j (if (= i (1- n)) 0 (1+ i)))
-    (setq pt1 (nth i points))
-    (setq pt2 (nth j points))
+  ; Shoelace formula for polygon area, walking each edge once
+  (setq pt1 (car points))
+  (foreach pt2 (append (cdr points) (list (car points)))
     (setq area (+ area (- (* (car pt1) (cadr pt2)) (* (car pt2) (cadr pt1)))))
-    (setq i (1+ i))
+    (setq pt1 pt2)
   )
   
   (setq area (/ (abs area) 2.0))
   (princ (strcat "Area calculated: " (rtos area 2 2) " square units"))
   area
 )
-(calculate-area {points_lisp})
 """
+_AREA_CALL = "(calculate-area %(points)s)\n"
+_AREA_TEMPLATE = _AREA_DEFUN + _AREA_CALL
 
-    def save_current_drawing(self, filepath: str) -> str:
-        """Generate AutoLISP code to save the current drawing"""
-        return f"""
+_AREA_LITERAL_TEMPLATE = """
+(progn
+  (princ "Area calculated: %(area).2f square units")
+  %(area)s
+)
+"""
+
+_SAVE_DEFUN = """
 (defun save-drawing (filepath)
-  (setq filepath {format_lisp_string(filepath)})
-  
   ; Save the current drawing
   (command "._SAVEAS" filepath)
   
   (princ (strcat "Drawing saved to: " filepath))
 )
-(save-drawing {format_lisp_string(filepath)})
 """
+_SAVE_CALL = "(save-drawing %(filepath)s)\n"
+_SAVE_TEMPLATE = _SAVE_DEFUN + _SAVE_CALL
+
+_EXECUTE_TEMPLATE = """
+; AutoLISP code execution
+%s
+"""
+
+# Defun blocks a LispBatch emits only once
+_DEFUNS = (_ROOM_DEFUN, _GRID_DEFUN, _LAYER_DEFUN, _TEXT_DEFUN, _DIMENSION_DEFUN,
+           _FURNITURE_DEFUN, _AREA_DEFUN, _SAVE_DEFUN)
+
+def _cacheable_args(args) -> bool:
+    """Only hashable arguments with float coordinates may key the LISP cache.
+
+    Coordinates are rendered as given, so (0, 0, 0) and (0.0, 0.0, 0.0) compare
+    equal but produce different LISP; anything other than floats bypasses the cache.
+    """
+    for arg in args:
+        if isinstance(arg, tuple):
+            if not _float_coords(arg):
+                return False
+        elif isinstance(arg, Point):
+            if not _float_coords((arg.x, arg.y, arg.z)):
+                return False
+        else:
+            try:
+                hash(arg)
+            except TypeError:  # lists, arrays, dicts from unvalidated fields
+                return False
+    return True
+
+def _float_coords(coords: tuple) -> bool:
+    """Whether a coordinate tuple (or tuple of them) holds only floats"""
+    return all(_float_coords(item) if type(item) is tuple else type(item) is float
+               for item in coords)
+
+def _freeze_points(points: Union[Sequence[PointLike], np.ndarray]) -> Tuple[Tuple[float, float, float], ...]:
+    """Turn a point list or (N, 3) array into a hashable tuple of coordinate tuples"""
+    if isinstance(points, np.ndarray):
+        return tuple(map(tuple, points.tolist()))
+    return tuple(map(point_coords, points))
+
+def memoize_lisp(method):
+    """Cache a generator's LISP on its arguments (see _cacheable_args)"""
+    cached = lru_cache(maxsize=LISP_CACHE_SIZE, typed=True)(method)
+    
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if _cacheable_args(args) and _cacheable_args(kwargs.values()):
+            return cached(self, *args, **kwargs)
+        return method(self, *args, **kwargs)
+    
+    wrapper.cache_info = cached.cache_info
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+class LispBatch:
+    """Collects generated LISP for one execution, emitting each defun only once.
+
+    Assemble multi-statement scripts here (or pass a list to execute_lisp)
+    rather than concatenating strings with += in a loop.
+    """
+    
+    def __init__(self):
+        self.parts: List[str] = []
+        self.defined = set()
+    
+    def add(self, lisp_code: str):
+        """Append generator output, keeping only the call if its defun was already emitted"""
+        for defun in _DEFUNS:
+            if lisp_code.startswith(defun):
+                if defun in self.defined:
+                    lisp_code = lisp_code[len(defun):]
+                else:
+                    self.defined.add(defun)
+                break
+        self.parts.append(lisp_code)
+    
+    def __len__(self) -> int:
+        return len(self.parts)
+    
+    def render(self) -> str:
+        """Join the collected LISP into a single buffer"""
+        return "\n".join(self.parts)
+
+class LispGenerator:
+    """Generates AutoLISP code for architectural functions"""
+    
+    __slots__ = ()
+    
+    @memoize_lisp
+    def create_wall(self, start_point: PointLike, end_point: PointLike, thickness: float, height: float) -> str:
+        """Generate AutoLISP code to create a wall"""
+        return _WALL_TEMPLATE % (*point_coords(start_point), *point_coords(end_point), thickness, height)
+
+    @memoize_lisp
+    def insert_door(self, wall_reference: str, position: PointLike, width: float, height: float,
+                    swing_direction: SwingDirection, door_type: DoorType = DoorType.SINGLE,
+                    wall_thickness: float = 100.0, ref_id: str = None) -> str:
+        """Generate AutoLISP code to insert a door with automatic annotation"""
+        swing_angle = swing_direction.angle
+        
+        ref_id_param = f'"{ref_id}"' if ref_id else 'nil'
+        
+        x, y, _ = point_coords(position)
+        return _DOOR_TEMPLATE % (x, y, width, height, wall_thickness,
+                                 swing_angle, door_type, ref_id_param)
+
+    @memoize_lisp
+    def insert_window(self, wall_reference: str, position: PointLike, width: float, height: float,
+                     sill_height: float, window_type: WindowType = WindowType.FIXED,
+                     glass_type: GlassType = GlassType.DOUBLE, ref_id: str = None) -> str:
+        """Generate AutoLISP code to insert a window with automatic annotation"""
+        ref_id_param = f'"{ref_id}"' if ref_id else 'nil'
+        
+        x, y, _ = point_coords(position)
+        return _WINDOW_TEMPLATE % (x, y, width, height, sill_height,
+                                   window_type, glass_type, ref_id_param)
+
+    def create_room(self, points: Union[Sequence[PointLike], np.ndarray], height: float) -> str:
+        """Generate AutoLISP code to create a room"""
+        return self._create_room(_freeze_points(points), height)
+    
+    @memoize_lisp
+    def _create_room(self, points: Tuple[Tuple[float, float, float], ...], height: float) -> str:
+        points_lisp = format_lisp_point_list(points)
+        
+        return _ROOM_TEMPLATE % {'points': points_lisp, 'height': height}
+
+    @memoize_lisp
+    def setup_grid(self, origin_point: PointLike, x_spacing: float, y_spacing: float, x_count: int, y_count: int) -> str:
+        """Generate AutoLISP code to setup a drawing grid"""
+        return _GRID_TEMPLATE % {'origin': format_lisp_point(origin_point), 'x_spacing': x_spacing,
+                                 'y_spacing': y_spacing, 'x_count': x_count, 'y_count': y_count}
 
-    def insert_door_simple(self, position: Point, width: float, height: float,
+    @memoize_lisp
+    def create_layer(self, name: str, color: int, line_type: str, line_weight: float) -> str:
+        """Generate AutoLISP code to create a layer"""
+        safe_name = sanitize_layer_name(name)
+        
+        return _LAYER_TEMPLATE % {'name': format_lisp_string(safe_name), 'color': color,
+                                  'line_type': format_lisp_string(line_type),
+                                  'line_weight': line_weight}
+
+    @memoize_lisp
+    def add_text_note(self, insertion_point: PointLike, text_string: str, height: float, rotation: float = 0.0) -> str:
+        """Generate AutoLISP code to add text annotation"""
+        return _TEXT_TEMPLATE % {'pos': format_lisp_point(insertion_point),
+                                 'text': format_lisp_string(text_string), 'height': height,
+                                 'rotation': rotation}
+
+    @memoize_lisp
+    def dimension_linear(self, start_point: PointLike, end_point: PointLike, offset_distance: float) -> str:
+        """Generate AutoLISP code to add linear dimension"""
+        return _DIMENSION_TEMPLATE % {'start': format_lisp_point(start_point),
+                                      'end': format_lisp_point(end_point),
+                                      'offset': offset_distance}
+
+    @memoize_lisp
+    def insert_furniture(self, insertion_point: PointLike, furniture_type: FurnitureType, rotation: float, scale: float) -> str:
+        """Generate AutoLISP code to insert furniture"""
+        block_name = furniture_type.block_name
+        
+        return _FURNITURE_TEMPLATE % {'pos': format_lisp_point(insertion_point),
+                                      'block_name': format_lisp_string(block_name),
+                                      'rotation': rotation, 'scale': scale}
+
+    def calculate_area(self, points: Union[Sequence[PointLike], np.ndarray], runtime: bool = False) -> str:
+        """Generate AutoLISP code to calculate area (computed in AutoCAD only if runtime is set)"""
+        return self._calculate_area(_freeze_points(points), runtime)
+    
+    @memoize_lisp
+    def _calculate_area(self, points: Tuple[Tuple[float, float, float], ...], runtime: bool) -> str:
+        if not runtime:
+            # The vertices are known here, so AutoCAD only needs to report the result
+            return _AREA_LITERAL_TEMPLATE % {'area': polygon_area(np.array(points, dtype=np.float64))}
+        
+        points_lisp = format_lisp_point_list(points)
+        
+        return _AREA_TEMPLATE % {'points': points_lisp}
+
+    @memoize_lisp
+    def save_current_drawing(self, filepath: str) -> str:
+        """Generate AutoLISP code to save the current drawing"""
+        return _SAVE_TEMPLATE % {'filepath': format_lisp_string(filepath)}
+
+    @memoize_lisp
+    def insert_door_simple(self, position: PointLike, width: float, height: float,
                           door_type: DoorType = DoorType.SINGLE, ref_id: str = None) -> str:
         """Generate AutoLISP code for simplified door insertion"""
         ref_id_param = f'"{ref_id}"' if ref_id else 'nil'
         
-        type_func_map = {
-            DoorType.SINGLE: "c:create-door-single",
-            DoorType.DOUBLE: "c:create-door-double",
-            DoorType.SLIDING: "c:create-door-sliding"
-        }
-        
-        func_name = type_func_map.get(door_type, "c:create-door-single")
-        return f"""({func_name} {position.x} {position.y} {width} {height} {ref_id_param})"""
+        func_name = door_type.lisp_fn
+        x, y, _ = point_coords(position)
+        return _DOOR_SIMPLE_TEMPLATE % (func_name, x, y, width, height, ref_id_param)
     
-    def insert_window_simple(self, position: Point, width: float, height: float,
+    @memoize_lisp
+    def insert_window_simple(self, position: PointLike, width: float, height: float,
                            sill_height: float, window_type: WindowType = WindowType.FIXED,
                            ref_id: str = None) -> str:
         """Generate AutoLISP code for simplified window insertion"""
         ref_id_param = f'"{ref_id}"' if ref_id else 'nil'
         
-        type_func_map = {
-            WindowType.FIXED: "c:create-window-fixed",
-            WindowType.CASEMENT: "c:create-window-casement",
-            WindowType.SLIDING: "c:create-window-sliding"
-        }
-        
-        func_name = type_func_map.get(window_type, "c:create-window-fixed")
-        return f"""({func_name} {position.x} {position.y} {width} {height} {sill_height} {ref_id_param})"""
+        func_name = window_type.lisp_fn
+        x, y, _ = point_coords(position)
+        return _WINDOW_SIMPLE_TEMPLATE % (func_name, x, y, width, height, sill_height, ref_id_param)
 
-    def execute_lisp(self, lisp_code: str) -> str:
-        """Prepare AutoLISP code for execution"""
-        return f"""
-; AutoLISP code execution
-{lisp_code}
-"""
\ No newline at end of file
+    def begin_batch(self) -> LispBatch:
+        """Start collecting LISP for several elements executed together"""
+        return LispBatch()
+
+    def execute_lisp(self, lisp_code: Union[str, Sequence[str], LispBatch]) -> str:
+        """Prepare AutoLISP code (a string, list of forms or batch) for execution"""
+        if isinstance(lisp_code, LispBatch):
+            lisp_code = lisp_code.render()
+        elif not isinstance(lisp_code, str):
+            lisp_code = "\n".join(lisp_code)
+        return _EXECUTE_TEMPLATE % lisp_code
\ No newline at end of file
@@ -1,11 +1,20 @@
 """
 Data models for the AutoCAD MCP Server
 """
-from dataclasses import dataclass
-from typing import List, Tuple, Optional, Dict, Any
+from dataclasses import dataclass, field
+from typing import List, Tuple, Optional, Dict, Any, FrozenSet
 from enum import Enum
+import numpy as np
 
-@dataclass
+try:
+    from enum import StrEnum
+except ImportError:  # Python < 3.11
+    class StrEnum(str, Enum):
+        """Enum whose members are strings that format as their value"""
+        __str__ = str.__str__
+        __format__ = str.__format__
+
+@dataclass(frozen=True, slots=True)
 class Point:
     """Represents a 2D or 3D point"""
     x: float
@@ -20,7 +29,7 @@ class Point:
         """Convert to 2D list format"""
         return [self.x, self.y]
 
-@dataclass
+@dataclass(slots=True)
 class Wall:
     """Represents a wall element"""
     start_point: Point
@@ -29,36 +38,54 @@ class Wall:
     height: float
     layer: str = "WALLS"
     
-class SwingDirection(Enum):
-    """Door swing directions"""
-    LEFT_IN = "left_in"
-    LEFT_OUT = "left_out"
-    RIGHT_IN = "right_in"
-    RIGHT_OUT = "right_out"
-
-class DoorType(Enum):
-    """Door types"""
-    SINGLE = "SINGLE"
-    DOUBLE = "DOUBLE"
-    SLIDING = "SLIDING"
-    POCKET = "POCKET"
-
-class WindowType(Enum):
-    """Window types"""
-    FIXED = "FIXED"
-    CASEMENT = "CASEMENT"
-    SLIDING = "SLIDING"
-    DOUBLE_HUNG = "DOUBLE-HUNG"
-    AWNING = "AWNING"
-
-class GlassType(Enum):
+class SwingDirection(StrEnum):
+    """Door swing directions, each with its swing angle in degrees"""
+    LEFT_IN = "left_in", 0
+    LEFT_OUT = "left_out", 180
+    RIGHT_IN = "right_in", 90
+    RIGHT_OUT = "right_out", 270
+    
+    def __new__(cls, value: str, angle: int):
+        member = str.__new__(cls, value)
+        member._value_ = value
+        member.angle = angle
+        return member
+
+class DoorType(StrEnum):
+    """Door types, each with the LISP command for simplified insertion"""
+    SINGLE = "SINGLE", "c:create-door-single"
+    DOUBLE = "DOUBLE", "c:create-door-double"
+    SLIDING = "SLIDING", "c:create-door-sliding"
+    POCKET = "POCKET", "c:create-door-single"
+    
+    def __new__(cls, value: str, lisp_fn: str):
+        member = str.__new__(cls, value)
+        member._value_ = value
+        member.lisp_fn = lisp_fn
+        return member
+
+class WindowType(StrEnum):
+    """Window types, each with the LISP command for simplified insertion"""
+    FIXED = "FIXED", "c:create-window-fixed"
+    CASEMENT = "CASEMENT", "c:create-window-casement"
+    SLIDING = "SLIDING", "c:create-window-sliding"
+    DOUBLE_HUNG = "DOUBLE-HUNG", "c:create-window-fixed"
+    AWNING = "AWNING", "c:create-window-fixed"
+    
+    def __new__(cls, value: str, lisp_fn: str):
+        member = str.__new__(cls, value)
+        member._value_ = value
+        member.lisp_fn = lisp_fn
+        return member
+
+class GlassType(StrEnum):
     """Glass types"""
     SINGLE = "SINGLE"
     DOUBLE = "DOUBLE"
     TRIPLE = "TRIPLE"
     TEMPERED = "TEMPERED"
 
-@dataclass
+@dataclass(slots=True)
 class Door:
     """Represents a door element"""
     wall_reference: str
@@ -71,7 +98,7 @@ class Door:
     ref_id: str = None
     layer: str = "DOORS"
 
-@dataclass
+@dataclass(slots=True)
 class Window:
     """Represents a window element"""
     wall_reference: str
@@ -84,16 +111,33 @@ class Window:
     ref_id: str = None
     layer: str = "WINDOWS"
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class Room:
     """Represents a room boundary"""
-    points: List[Point]
+    points: np.ndarray  # (N, 3) float64 vertices; a list of Points is converted
     height: float
     name: str = ""
     area: float = 0.0
     layer: str = "ROOMS"
+    
+    def __post_init__(self):
+        if not isinstance(self.points, np.ndarray):
+            self.points = np.array([(point.x, point.y, point.z) for point in self.points],
+                                   dtype=np.float64).reshape(-1, 3)
+    
+    def add_point(self, x: float, y: float, z: float = 0.0):
+        """Append a vertex to the boundary"""
+        self.points = np.vstack((self.points, (x, y, z)))
+    
+    def __eq__(self, other):
+        # The generated __eq__ would compare the arrays elementwise and raise
+        if not isinstance(other, Room):
+            return NotImplemented
+        return (np.array_equal(self.points, other.points)
+                and (self.height, self.name, self.area, self.layer)
+                == (other.height, other.name, other.area, other.layer))
 
-@dataclass
+@dataclass(slots=True)
 class Layer:
     """Represents an AutoCAD layer"""
     name: str
@@ -101,7 +145,7 @@ class Layer:
     line_type: str
     line_weight: float
     
-@dataclass
+@dataclass(slots=True)
 class TextNote:
     """Represents a text annotation"""
     insertion_point: Point
@@ -110,7 +154,7 @@ class TextNote:
     rotation: float = 0.0
     layer: str = "TEXT"
 
-@dataclass
+@dataclass(slots=True)
 class Dimension:
     """Represents a dimension annotation"""
     start_point: Point
@@ -119,15 +163,21 @@ class Dimension:
     dimension_type: str = "linear"
     layer: str = "DIMENSIONS"
 
-class FurnitureType(Enum):
-    """Types of furniture"""
-    CHAIR = "chair"
-    TABLE = "table"
-    BED = "bed"
-    SOFA = "sofa"
-    DESK = "desk"
+class FurnitureType(StrEnum):
+    """Types of furniture, each with its (simplified) block name"""
+    CHAIR = "chair", "CHAIR_BLOCK"
+    TABLE = "table", "TABLE_BLOCK"
+    BED = "bed", "BED_BLOCK"
+    SOFA = "sofa", "SOFA_BLOCK"
+    DESK = "desk", "DESK_BLOCK"
+    
+    def __new__(cls, value: str, block_name: str):
+        member = str.__new__(cls, value)
+        member._value_ = value
+        member.block_name = block_name
+        return member
 
-@dataclass
+@dataclass(slots=True)
 class Furniture:
     """Represents furniture placement"""
     insertion_point: Point
@@ -142,6 +192,10 @@ class AutoCADConnection:
     instance_id: str
     application: Any = None
     connected: bool = False
+    document: Any = None
+    model_space: Any = None
+    last_alive_check: float = 0.0  # time.monotonic() of the last successful probe
+    support_paths: FrozenSet[str] = frozenset()  # normalized SupportPath entries
     
 @dataclass
 class LispExecutionResult:
@@ -151,15 +205,18 @@ class LispExecutionResult:
     error_message: str = ""
     execution_time: float = 0.0
 
-@dataclass
+@dataclass(slots=True)
 class DrawingTemplate:
     """Represents a drawing template"""
     name: str
     filepath: str
     units: str = "inches"
     scale: float = 1.0
-    layers: List[Layer] = None
-    
-    def __post_init__(self):
-        if self.layers is None:
-            self.layers = []
\ No newline at end of file
+    layers: List[Layer] = field(default_factory=list)
+
+# Enum members keyed by value, so request parsing is a single dict lookup
+SWING_BY_VALUE = {member.value: member for member in SwingDirection}
+DOOR_TYPE_BY_VALUE = {member.value: member for member in DoorType}
+WINDOW_TYPE_BY_VALUE = {member.value: member for member in WindowType}
+GLASS_TYPE_BY_VALUE = {member.value: member for member in GlassType}
+FURNITURE_BY_VALUE = {member.value: member for member in FurnitureType}
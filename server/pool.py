@@ -0,0 +1,103 @@
+"""
+Connection pool for AutoCAD COM connections
+"""
+import logging
+import queue
+import threading
+from contextlib import contextmanager
+from typing import Iterator, Optional
+from server.models import AutoCADConnection
+from server.utils import AutoCADConnectionError, AutoCADPoolTimeoutError
+
+logger = logging.getLogger(__name__)
+
+class AutoCADPool:
+    """Thread-safe pool of pre-warmed AutoCAD connections with min/max sizing"""
+
+    def __init__(self, interface, min_size: int = 1, max_size: int = 5, timeout: float = 30):
+        self.interface = interface
+        self.min_size = min(min_size, max_size)
+        self.max_size = max_size
+        self.timeout = timeout
+        # LIFO keeps the most recently used (warmest) connection in front
+        self._idle: "queue.LifoQueue[AutoCADConnection]" = queue.LifoQueue(maxsize=max_size)
+        self._lock = threading.RLock()
+        self._created = 0
+        self._serial = 0
+
+    def _reserve(self, limit: int) -> Optional[str]:
+        """Claim a connection slot below `limit`, returning its instance id"""
+        with self._lock:
+            if self._created >= limit:
+                return None
+            self._created += 1
+            self._serial += 1
+            return f"pool-{self._serial - 1}"
+
+    def _create(self, instance_id: str) -> AutoCADConnection:
+        """Open a pooled connection for a reserved slot, giving the slot back on failure"""
+        try:
+            return self.interface.connect_to_autocad(instance_id)
+        except BaseException:
+            with self._lock:
+                self._created -= 1
+            raise
+
+    def _discard(self, connection: AutoCADConnection):
+        """Drop a dead connection, freeing its slot for a replacement"""
+        logger.warning(f"Recycling dead pooled connection {connection.instance_id}")
+        self.interface.disconnect(connection.instance_id)
+        with self._lock:
+            self._created -= 1
+
+    def warm(self) -> int:
+        """Open connections up to min_size, returning how many were created"""
+        created = 0
+        while (instance_id := self._reserve(self.min_size)) is not None:
+            try:
+                connection = self._create(instance_id)
+            except AutoCADConnectionError as e:
+                logger.warning(f"Stopped warming AutoCAD pool: {str(e)}")
+                break
+            self._idle.put_nowait(connection)
+            created += 1
+        logger.info(f"AutoCAD pool warmed with {created} connection(s)")
+        return created
+
+    def warm_in_background(self) -> threading.Thread:
+        """Warm the pool on a daemon thread so startup is not blocked by AutoCAD"""
+        thread = threading.Thread(target=self.warm, name="autocad-pool-warmer", daemon=True)
+        thread.start()
+        return thread
+
+    def _checkout(self) -> AutoCADConnection:
+        """Take a live idle connection, growing the pool or waiting if none is idle"""
+        while True:
+            try:
+                connection = self._idle.get_nowait()
+            except queue.Empty:
+                connection = None
+
+            if connection is None:
+                instance_id = self._reserve(self.max_size)
+                if instance_id is not None:
+                    # Connecting can take seconds; do it without holding the lock
+                    return self._create(instance_id)
+                try:
+                    connection = self._idle.get(timeout=self.timeout)
+                except queue.Empty:
+                    raise AutoCADPoolTimeoutError(
+                        f"No AutoCAD connection became available within {self.timeout} seconds")
+
+            if self.interface.is_connection_alive(connection):
+                return connection
+            self._discard(connection)
+
+    @contextmanager
+    def acquire(self) -> Iterator[AutoCADConnection]:
+        """Check out a connection for the duration of a with-block"""
+        connection = self._checkout()
+        try:
+            yield connection
+        finally:
+            self._idle.put_nowait(connection)
@@ -0,0 +1,202 @@
+"""
+Request schemas for the AutoCAD MCP Server API
+Each schema is compiled once at import time into a validator that checks
+required fields and returns the request data coerced to native types.
+"""
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from server.geom import points_array
+from server.models import (SWING_BY_VALUE, DOOR_TYPE_BY_VALUE, WINDOW_TYPE_BY_VALUE,
+                           GLASS_TYPE_BY_VALUE, FURNITURE_BY_VALUE)
+from server.utils import ValidationError
+
+Validator = Callable[[Any], Dict[str, Any]]
+FieldSpec = Tuple[Optional[Callable[[Any], Any]], Any]
+
+_REQUIRED = object()
+
+def required(coerce: Callable[[Any], Any] = None) -> FieldSpec:
+    """Declare a required field, optionally coerced by `coerce`"""
+    return (coerce, _REQUIRED)
+
+def optional(coerce: Callable[[Any], Any] = None, default: Any = None) -> FieldSpec:
+    """Declare an optional field; defaults are coerced like supplied values"""
+    return (coerce, default)
+
+def parse_point_fast(point_data: Dict[str, float]) -> Tuple[float, float, float]:
+    """Parse point data from request into an (x, y, z) tuple"""
+    return (float(point_data.get('x', 0.0)),
+            float(point_data.get('y', 0.0)),
+            float(point_data.get('z', 0.0)))
+
+def object_list(value: Any) -> List[Dict[str, Any]]:
+    """Require a non-empty list of JSON objects"""
+    if not isinstance(value, list) or not value:
+        raise ValueError("must be a non-empty list")
+    if not all(isinstance(item, dict) for item in value):
+        raise ValueError("every item must be an object")
+    return value
+
+def enum_of(mapping: Dict[Any, Any]) -> Callable[[Any], Any]:
+    """Build a coercer that looks enum members up by value"""
+    allowed = ', '.join(str(value) for value in mapping)
+    
+    def coerce(value: Any) -> Any:
+        try:
+            return mapping[value]
+        except (KeyError, TypeError):
+            raise ValueError(f"must be one of {allowed}")
+    
+    return coerce
+
+def positive_float(value: Any) -> float:
+    """Coerce to float, rejecting zero and negative values"""
+    value = float(value)
+    if value <= 0:
+        raise ValueError("must be positive")
+    return value
+
+def compile_schema(**fields: FieldSpec) -> Validator:
+    """Compile field specs into a validator returning coerced request data"""
+    required_names = tuple(name for name, (_, default) in fields.items() if default is _REQUIRED)
+    steps = tuple((name, coerce, default) for name, (coerce, default) in fields.items())
+
+    def validate(data: Any) -> Dict[str, Any]:
+        if not isinstance(data, dict):
+            raise ValidationError("Request body must be a JSON object")
+        missing = [name for name in required_names if name not in data]
+        if missing:
+            raise ValidationError(f"Missing required fields: {', '.join(missing)}")
+
+        result = {}
+        for name, coerce, default in steps:
+            value = data.get(name, default)
+            if coerce is not None and value is not None:
+                try:
+                    value = coerce(value)
+                except (TypeError, ValueError, AttributeError) as e:
+                    raise ValidationError(f"Invalid value for '{name}': {str(e)}")
+            result[name] = value
+        return result
+
+    return validate
+
+# Core drawing elements
+WALL_SCHEMA = compile_schema(
+    start_point=required(parse_point_fast),
+    end_point=required(parse_point_fast),
+    thickness=required(positive_float),
+    height=required(positive_float),
+    instance_id=optional()
+)
+
+DOOR_SCHEMA = compile_schema(
+    wall_reference=required(),
+    position=required(parse_point_fast),
+    width=required(float),
+    height=required(float),
+    swing_direction=required(enum_of(SWING_BY_VALUE)),
+    door_type=optional(enum_of(DOOR_TYPE_BY_VALUE), 'SINGLE'),
+    wall_thickness=optional(float, 100.0),
+    ref_id=optional(),
+    instance_id=optional()
+)
+
+WINDOW_SCHEMA = compile_schema(
+    wall_reference=required(),
+    position=required(parse_point_fast),
+    width=required(float),
+    height=required(float),
+    sill_height=required(float),
+    window_type=optional(enum_of(WINDOW_TYPE_BY_VALUE), 'FIXED'),
+    glass_type=optional(enum_of(GLASS_TYPE_BY_VALUE), 'DOUBLE'),
+    ref_id=optional(),
+    instance_id=optional()
+)
+
+DOOR_SIMPLE_SCHEMA = compile_schema(
+    position=required(parse_point_fast),
+    width=required(float),
+    height=required(float),
+    door_type=optional(enum_of(DOOR_TYPE_BY_VALUE), 'SINGLE'),
+    ref_id=optional(),
+    instance_id=optional()
+)
+
+WINDOW_SIMPLE_SCHEMA = compile_schema(
+    position=required(parse_point_fast),
+    width=required(float),
+    height=required(float),
+    sill_height=required(float),
+    window_type=optional(enum_of(WINDOW_TYPE_BY_VALUE), 'FIXED'),
+    ref_id=optional(),
+    instance_id=optional()
+)
+
+ROOM_SCHEMA = compile_schema(
+    points=required(points_array),
+    height=required(float),
+    instance_id=optional()
+)
+
+# Layout and organization
+GRID_SCHEMA = compile_schema(
+    origin_point=required(parse_point_fast),
+    x_spacing=required(float),
+    y_spacing=required(float),
+    x_count=required(int),
+    y_count=required(int),
+    instance_id=optional()
+)
+
+LAYER_SCHEMA = compile_schema(
+    name=required(),
+    color=required(int),
+    line_type=required(),
+    line_weight=required(float),
+    instance_id=optional()
+)
+
+# Annotation and dimensions
+TEXT_SCHEMA = compile_schema(
+    insertion_point=required(parse_point_fast),
+    text_string=required(),
+    height=required(float),
+    rotation=optional(float, 0.0),
+    instance_id=optional()
+)
+
+DIMENSION_SCHEMA = compile_schema(
+    start_point=required(parse_point_fast),
+    end_point=required(parse_point_fast),
+    offset_distance=required(float),
+    instance_id=optional()
+)
+
+# Furniture and fixtures
+FURNITURE_SCHEMA = compile_schema(
+    insertion_point=required(parse_point_fast),
+    furniture_type=required(enum_of(FURNITURE_BY_VALUE)),
+    rotation=optional(float, 0.0),
+    scale=optional(float, 1.0),
+    instance_id=optional()
+)
+
+BATCH_SCHEMA = compile_schema(
+    operations=required(object_list),
+    instance_id=optional()
+)
+
+# Utilities and server management
+AREA_SCHEMA = compile_schema(
+    points=required(points_array)
+)
+
+LISP_SCHEMA = compile_schema(
+    lisp_code=required(),
+    instance_id=optional()
+)
+
+SAVE_SCHEMA = compile_schema(
+    filepath=required(),
+    instance_id=optional()
+)
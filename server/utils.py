@@ -1,41 +1,67 @@
 """
 Utility functions for the AutoCAD MCP Server
 """
+import atexit
 import logging
+import queue
 import time
 import math
-from typing import List, Tuple, Dict, Any, Optional
-from functools import wraps
+import re
+import secrets
+from typing import List, Sequence, Tuple, Dict, Any, Optional, Union
+from functools import lru_cache, wraps
+from itertools import chain
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+import numpy as np
+from server.geom import polygon_area
 from server.models import Point, Room
 
+PointLike = Union[Point, Tuple[float, float, float]]
+
+_log_listener: Optional[QueueListener] = None
+
 def setup_logging(log_level: str = 'INFO', log_file: str = 'autocad_mcp.log'):
-    """Setup logging configuration"""
-    logging.basicConfig(
-        level=getattr(logging, log_level.upper()),
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler()
-        ]
-    )
+    """Setup logging so request threads only enqueue records; a listener thread does the I/O"""
+    global _log_listener
+    if _log_listener is None:
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        file_handler = RotatingFileHandler(log_file, maxBytes=10 * 1024 * 1024, backupCount=5)
+        stream_handler = logging.StreamHandler()
+        for handler in (file_handler, stream_handler):
+            handler.setFormatter(formatter)
+        
+        log_queue = queue.Queue(-1)
+        _log_listener = QueueListener(log_queue, file_handler, stream_handler,
+                                      respect_handler_level=True)
+        _log_listener.start()
+        atexit.register(_log_listener.stop)
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setFormatter(logging.Formatter('%(message)s'))
+        logging.basicConfig(handlers=[queue_handler])
+    
+    logging.getLogger().setLevel(getattr(logging, log_level.upper()))
     return logging.getLogger(__name__)
 
 def timing_decorator(func):
     """Decorator to measure function execution time"""
+    log = logging.getLogger(func.__module__)
+    
     @wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time.time()
+        # Only pay for timing when the debug record would actually be emitted
+        if not log.isEnabledFor(logging.DEBUG):
+            return func(*args, **kwargs)
+        start_time = time.perf_counter_ns()
         result = func(*args, **kwargs)
-        execution_time = time.time() - start_time
-        logging.debug(f"{func.__name__} executed in {execution_time:.4f} seconds")
+        log.debug("%s executed in %.4f seconds", func.__name__,
+                  (time.perf_counter_ns() - start_time) * 1e-9)
         return result
     return wrapper
 
 def validate_point(point: Point) -> bool:
     """Validate that a point has valid coordinates"""
     try:
-        return all(isinstance(coord, (int, float)) and not math.isnan(coord) 
-                  for coord in [point.x, point.y, point.z])
+        return math.isfinite(point.x) and math.isfinite(point.y) and math.isfinite(point.z)
     except (TypeError, AttributeError):
         return False
 
@@ -48,22 +74,27 @@ def validate_positive_number(value: float, name: str) -> bool:
 
 def calculate_distance(point1: Point, point2: Point) -> float:
     """Calculate distance between two points"""
-    return math.sqrt((point2.x - point1.x)**2 + (point2.y - point1.y)**2 + (point2.z - point1.z)**2)
+    return math.hypot(point2.x - point1.x, point2.y - point1.y, point2.z - point1.z)
+
+_NUMPY_AREA_MIN_POINTS = 8  # smaller polygons use the pure-Python shoelace loop
 
-def calculate_area_from_points(points: List[Point]) -> float:
+def calculate_area_from_points(points: Union[List[Point], np.ndarray]) -> float:
     """Calculate area of a polygon defined by points using shoelace formula"""
     if len(points) < 3:
         return 0.0
     
-    area = 0.0
-    n = len(points)
-    
-    for i in range(n):
-        j = (i + 1) % n
-        area += points[i].x * points[j].y
-        area -= points[j].x * points[i].y
-    
-    return abs(area) / 2.0
+    if not isinstance(points, np.ndarray):
+        if len(points) < _NUMPY_AREA_MIN_POINTS:
+            # Array setup costs more than the loop for small polygons
+            total = 0.0
+            previous = points[-1]
+            for point in points:
+                total += previous.x * point.y - point.x * previous.y
+                previous = point
+            return abs(total) / 2.0
+        points = np.fromiter((c for point in points for c in (point.x, point.y)),
+                             dtype=np.float64, count=2 * len(points)).reshape(-1, 2)
+    return polygon_area(points)
 
 def convert_to_autocad_point(point: Point) -> List[float]:
     """Convert Point object to AutoCAD-compatible list"""
@@ -78,45 +109,67 @@ def convert_from_autocad_point(autocad_point: List[float]) -> Point:
     else:
         raise ValueError("Invalid AutoCAD point format")
 
+def _validate_and_area(points: List[Point]) -> Tuple[bool, float]:
+    """Validate every point (as validate_point does) and compute the shoelace area in one pass"""
+    total = 0.0
+    first = None
+    for point in points:
+        try:
+            x, y, z = point.x, point.y, point.z
+            if not (math.isfinite(x) and math.isfinite(y) and math.isfinite(z)):
+                return False, 0.0
+        except (TypeError, AttributeError):
+            return False, 0.0
+        if first is None:
+            first = (x, y)
+        else:
+            total += previous_x * y - x * previous_y
+        previous_x, previous_y = x, y
+    total += previous_x * first[1] - first[0] * previous_y
+    return True, abs(total) / 2.0
+
 def validate_room_points(points: List[Point]) -> bool:
     """Validate that room points form a valid polygon"""
     if len(points) < 3:
         logging.error("Room must have at least 3 points")
         return False
     
-    # Check if all points are valid
-    if not all(validate_point(point) for point in points):
+    # Check if all points are valid, accumulating the area on the same pass
+    valid, area = _validate_and_area(points)
+    if not valid:
         logging.error("All room points must be valid")
         return False
     
     # Check if polygon is not self-intersecting (basic check)
     if len(points) > 3:
         # For simplicity, just check if area is positive
-        area = calculate_area_from_points(points)
         if area <= 0:
             logging.error("Room points do not form a valid polygon")
             return False
     
     return True
 
+# Conversion factors to inches
+_TO_INCHES = {
+    'mm': 0.0393701,
+    'cm': 0.393701,
+    'inches': 1.0,
+    'feet': 12.0,
+    'meters': 39.3701
+}
+# (from_unit, to_unit) -> multiplier, via inches
+_UNIT_FACTORS = {(from_unit, to_unit): from_factor / to_factor
+                 for from_unit, from_factor in _TO_INCHES.items()
+                 for to_unit, to_factor in _TO_INCHES.items()}
+
 def convert_units(value: float, from_unit: str, to_unit: str) -> float:
     """Convert between different units"""
-    # Conversion factors to inches
-    to_inches = {
-        'mm': 0.0393701,
-        'cm': 0.393701,
-        'inches': 1.0,
-        'feet': 12.0,
-        'meters': 39.3701
-    }
-    
-    if from_unit not in to_inches or to_unit not in to_inches:
+    try:
+        return value * _UNIT_FACTORS[(from_unit, to_unit)]
+    except KeyError:
         raise ValueError(f"Unsupported unit conversion: {from_unit} to {to_unit}")
-    
-    # Convert to inches first, then to target unit
-    inches = value * to_inches[from_unit]
-    return inches / to_inches[to_unit]
 
+@lru_cache(maxsize=256)
 def format_lisp_string(text: str) -> str:
     """Format a string for use in AutoLISP code"""
     # Escape special characters
@@ -124,21 +177,39 @@ def format_lisp_string(text: str) -> str:
     text = text.replace('"', '\\"')
     return f'"{text}"'
 
-def format_lisp_point(point: Point) -> str:
+def point_coords(point: PointLike) -> Tuple[float, float, float]:
+    """Return (x, y, z) for a Point or an already-unpacked coordinate tuple"""
+    return point if isinstance(point, tuple) else (point.x, point.y, point.z)
+
+_LISP_POINT = "(%s %s %s)"
+_QUOTED_LISP_POINT = "'" + _LISP_POINT
+
+def format_lisp_point(point: PointLike) -> str:
     """Format a point for use in AutoLISP code"""
-    return f"'({point.x} {point.y} {point.z})"
+    return _QUOTED_LISP_POINT % point_coords(point)
+
+def format_lisp_point_list(points: Union[Sequence[PointLike], np.ndarray]) -> str:
+    """Format a sequence of points (or an (N, 3) array) for use in AutoLISP code"""
+    # Every coordinate is substituted by a single % call on a repeated template
+    if isinstance(points, np.ndarray):
+        coords = tuple(points.ravel().tolist())
+    else:
+        coords = tuple(chain.from_iterable(map(point_coords, points)))
+    return "'(" + " ".join([_LISP_POINT] * (len(coords) // 3)) % coords + ")"
+
+_INVALID_LAYER_CHARS = str.maketrans({char: '_' for char in '<>:"/\\|?*'})
 
-def format_lisp_point_list(points: List[Point]) -> str:
-    """Format a list of points for use in AutoLISP code"""
-    point_strings = [f"({point.x} {point.y} {point.z})" for point in points]
-    return f"'({' '.join(point_strings)})"
+# Names that sanitize_layer_name would return unchanged
+_SAFE_LAYER_NAME = re.compile(r'\A[A-Za-z_$-][A-Za-z0-9_$-]{0,254}\Z')
 
+@lru_cache(maxsize=512)  # thread-safe; layer names repeat across a session
 def sanitize_layer_name(name: str) -> str:
     """Sanitize layer name for AutoCAD compatibility"""
-    # Remove invalid characters
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        name = name.replace(char, '_')
+    if _SAFE_LAYER_NAME.match(name):
+        return name
+    
+    # Replace invalid characters in a single pass
+    name = name.translate(_INVALID_LAYER_CHARS)
     
     # Ensure name doesn't start with a number
     if name and name[0].isdigit():
@@ -149,8 +220,7 @@ def sanitize_layer_name(name: str) -> str:
 
 def generate_unique_id() -> str:
     """Generate a unique ID for objects"""
-    import uuid
-    return str(uuid.uuid4())[:8]
+    return secrets.token_hex(4)
 
 class ValidationError(Exception):
     """Custom exception for validation errors"""
@@ -158,4 +228,8 @@ class ValidationError(Exception):
 
 class AutoCADConnectionError(Exception):
     """Custom exception for AutoCAD connection errors"""
+    pass
+
+class AutoCADPoolTimeoutError(AutoCADConnectionError):
+    """Raised when no pooled AutoCAD connection becomes available in time"""
     pass
\ No newline at end of file
@@ -3,14 +3,23 @@ Test suite for AutoCAD MCP Server
 Tests core functionality without requiring AutoCAD connection
 """
 import pytest
-import json
+import os
+import threading
+import time
+from concurrent.futures import Future
 from server.app import app
-from server.models import Point, Wall, Door, Window, SwingDirection, FurnitureType
+from server.models import Point, Wall, Door, Window, Room, SwingDirection, FurnitureType
 from server.utils import (
-    validate_point, validate_positive_number, calculate_area_from_points,
-    convert_units, sanitize_layer_name
+    validate_point, validate_positive_number, calculate_area_from_points, calculate_distance,
+    convert_units, sanitize_layer_name, ValidationError, AutoCADConnectionError,
+    AutoCADPoolTimeoutError
 )
 from server.lisp_generator import LispGenerator
+from server.geom import points_array, distances_batch
+from server.autocad_interface import AutoCADInterface, LISP_PATH, _wait_until
+from server.models import AutoCADConnection, LispExecutionResult
+from server.pool import AutoCADPool
+from server.schemas import WALL_SCHEMA, DOOR_SCHEMA
 
 # Test fixtures
 @pytest.fixture
@@ -35,6 +44,18 @@ def lisp_generator():
     """LISP generator instance"""
     return LispGenerator()
 
+@pytest.fixture
+def make_interface():
+    """AutoCADInterface factory that stops each COM worker after the test"""
+    interfaces = []
+    def make(**kwargs):
+        interface = AutoCADInterface(**kwargs)
+        interfaces.append(interface)
+        return interface
+    yield make
+    for interface in interfaces:
+        interface.shutdown()
+
 # Utility function tests
 class TestUtilityFunctions:
     
@@ -77,6 +98,27 @@ class TestUtilityFunctions:
         area = calculate_area_from_points(points)
         assert area == 40.0  # 0.5 * base * height = 0.5 * 10 * 8
     
+    def test_calculate_area_array(self):
+        """Test area calculation from a parsed point array"""
+        points = points_array([{"x": 0, "y": 0}, {"x": 100, "y": 0},
+                               {"x": 100, "y": 80}, {"x": 0, "y": 80}])
+        assert points.shape == (4, 3)
+        assert calculate_area_from_points(points) == 8000.0
+    
+    def test_distances_batch(self):
+        """Test batched distances between matching point rows"""
+        a = points_array([{"x": 0, "y": 0}, {"x": 1, "y": 1, "z": 1}])
+        b = points_array([{"x": 3, "y": 4}, {"x": 1, "y": 1, "z": 1}])
+        assert distances_batch(a, b).tolist() == [5.0, 0.0]
+        assert calculate_distance(Point(0, 0), Point(3, 4)) == 5.0
+    
+    def test_points_array_rejects_non_finite(self):
+        """Test point arrays reject missing or non-numeric coordinates"""
+        with pytest.raises(ValueError):
+            points_array([{"x": None, "y": 0}])
+        with pytest.raises(ValueError):
+            points_array([{"x": "abc", "y": 0}])
+    
     def test_convert_units(self):
         """Test unit conversion"""
         # Feet to inches
@@ -113,7 +155,28 @@ class TestModels:
         point = Point(1, 2, 3)
         assert point.to_list() == [1, 2, 3]
         assert point.to_2d_list() == [1, 2]
-    
+
+    def test_room_points_array(self):
+        """Test Room stores its vertices as an (N, 3) array"""
+        room = Room([Point(0, 0), Point(100, 0)], 96)
+        room.add_point(100, 50)
+        assert room.points.shape == (3, 3)
+        assert room.points[2].tolist() == [100.0, 50.0, 0.0]
+
+    def test_room_equality(self):
+        """Test Room equality compares vertices without raising on arrays"""
+        room = Room([Point(0, 0), Point(100, 0), Point(100, 50)], 96)
+        assert room == Room([Point(0, 0), Point(100, 0), Point(100, 50)], 96)
+        assert room != Room([Point(0, 0), Point(100, 0), Point(0, 50)], 96)
+        assert room != Room([Point(0, 0), Point(100, 0)], 96)
+        assert room != Room([Point(0, 0), Point(100, 0), Point(100, 50)], 120)
+
+    def test_point_is_hashable(self):
+        """Test Point can key dicts and sets"""
+        assert len({Point(1.0, 2.0), Point(1.0, 2.0, 0.0)}) == 1
+        with pytest.raises(Exception):
+            Point(1.0, 2.0).x = 3.0
+
     def test_wall_creation(self):
         """Test Wall model creation"""
         start = Point(0, 0, 0)
@@ -154,6 +217,39 @@ class TestLispGenerator:
         assert "0 0 0" in lisp_code
         assert "100 0 0" in lisp_code
     
+    def test_create_wall_lisp_memoized(self, lisp_generator):
+        """Test repeated float-coordinate walls are served from the LISP cache"""
+        start, end = (0.0, 0.0, 0.0), (250.0, 0.0, 0.0)
+        hits = lisp_generator.create_wall.cache_info().hits
+        first = lisp_generator.create_wall(start, end, 6.0, 96.0)
+        assert lisp_generator.create_wall(start, end, 6.0, 96.0) is first
+        assert lisp_generator.create_wall.cache_info().hits == hits + 1
+        # Integer coordinates render differently, so they must not share the entry
+        assert "0 0 0" in lisp_generator.create_wall((0, 0, 0), (250, 0, 0), 6.0, 96.0)
+    
+    def test_create_room_lisp_memoized(self, lisp_generator):
+        """Test identical room outlines reuse generated LISP"""
+        points = points_array([{'x': 0, 'y': 0}, {'x': 300, 'y': 0}, {'x': 300, 'y': 200}])
+        first = lisp_generator.create_room(points, 96.0)
+        assert lisp_generator.create_room(points.copy(), 96.0) is first
+        assert "(0.0 0.0 0.0) (300.0 0.0 0.0) (300.0 200.0 0.0)" in first
+
+    def test_batch_emits_defun_once(self, lisp_generator):
+        """Test a LISP batch defines each helper function only once"""
+        batch = lisp_generator.begin_batch()
+        batch.add(lisp_generator.add_text_note((0.0, 0.0, 0.0), "A", 2.5))
+        batch.add(lisp_generator.add_text_note((10.0, 0.0, 0.0), "B", 2.5))
+        lisp_code = batch.render()
+
+        assert lisp_code.count("(defun add-text-note") == 1
+        assert lisp_code.count("(add-text-note ") == 2
+
+    def test_calculate_area_lisp_literal(self, lisp_generator):
+        """Test area LISP reports a precomputed value unless runtime evaluation is requested"""
+        points = [(0.0, 0.0, 0.0), (10.0, 0.0, 0.0), (10.0, 5.0, 0.0)]
+        assert "Area calculated: 25.00" in lisp_generator.calculate_area(points)
+        assert "(defun calculate-area" in lisp_generator.calculate_area(points, runtime=True)
+
     def test_insert_door_lisp(self, lisp_generator):
         """Test door insertion LISP code generation"""
         position = Point(50, 0, 0)
@@ -211,7 +307,7 @@ class TestAPIEndpoints:
         """Test health check endpoint"""
         response = client.get('/')
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['status'] == 'healthy'
         assert data['service'] == 'AutoCAD MCP Server'
     
@@ -227,7 +323,7 @@ class TestAPIEndpoints:
         response = client.post('/api/utils/calculate_area', 
                               json={'points': points_data})
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['success'] == True
         assert data['area'] == 8000.0
     
@@ -241,7 +337,7 @@ class TestAPIEndpoints:
         response = client.post('/api/utils/calculate_area', 
                               json={'points': points_data})
         assert response.status_code == 400
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['success'] == False
     
     def test_wall_creation_validation(self, client):
@@ -269,6 +365,105 @@ class TestAPIEndpoints:
         response = client.post('/api/drawing/door', json=door_data)
         assert response.status_code == 400
     
+    def test_batch_rejects_unknown_type(self, client):
+        """Test batch drawing with an unknown operation type"""
+        response = client.post('/api/drawing/batch', json={
+            "operations": [{"type": "staircase"}]
+        })
+        assert response.status_code == 400
+        assert "unknown type" in response.get_json()['error']
+    
+    def test_door_with_unhashable_reference(self, client):
+        """Test an unhashable free-form field bypasses the LISP cache instead of failing"""
+        response = client.post('/api/drawing/door', json={
+            "wall_reference": {"a": 1}, "position": {"x": 50, "y": 0}, "width": 36,
+            "height": 84, "swing_direction": "left_in", "instance_id": "default"
+        })
+        assert "unhashable" not in str(response.get_json())
+    
+    def test_batch_rejects_unhashable_type(self, client):
+        """Test batch drawing rejects a non-string operation type as unknown"""
+        response = client.post('/api/drawing/batch', json={
+            "operations": [{"type": ["wall"]}]
+        })
+        assert response.status_code == 400
+        assert "unknown type" in response.get_json()['error']
+    
+    def test_batch_validates_each_operation(self, client):
+        """Test batch drawing applies per-element validation"""
+        batch_data = {
+            "operations": [
+                {"type": "wall", "start_point": {"x": 0, "y": 0}, "end_point": {"x": 100, "y": 0},
+                 "thickness": 6, "height": 96},
+                {"type": "door", "wall_reference": "wall_1", "position": {"x": 50, "y": 0},
+                 "width": 20, "height": 84, "swing_direction": "left_in"}
+            ]
+        }
+        response = client.post('/api/drawing/batch', json=batch_data)
+        assert response.status_code == 400
+        assert "Operation 1 (door)" in response.get_json()['error']
+    
+    def test_connection_error_returns_503(self, client, monkeypatch):
+        """Test a lost AutoCAD connection surfaces as 503, not a validation error"""
+        from server import app as app_module
+        def fail(*args, **kwargs):
+            raise AutoCADConnectionError("AutoCAD not running")
+        monkeypatch.setattr(app_module.autocad_interface, 'execute_lisp', fail)
+        wall_data = {"start_point": {"x": 0, "y": 0}, "end_point": {"x": 100, "y": 0},
+                     "thickness": 6, "height": 96}
+        response = client.post('/api/drawing/wall', json=wall_data)
+        assert response.status_code == 503
+        assert response.get_json()['error'] == "AutoCAD Connection Error"
+    
+    def test_simple_door_message_uses_type_value(self, client, monkeypatch):
+        """Test the simple door message names the door type by its value"""
+        from server import app as app_module
+        monkeypatch.setattr(app_module.autocad_interface, 'execute_lisp',
+                            lambda *args, **kwargs: LispExecutionResult(success=True))
+        response = client.post('/api/drawing/door/simple', json={
+            "position": {"x": 50, "y": 0}, "width": 36, "height": 84, "instance_id": "default"
+        })
+        assert response.get_json()['message'] == "SINGLE door inserted successfully"
+    
+    def test_only_idempotent_builders_are_cacheable(self):
+        """Test drawing builders are never marked cacheable"""
+        from server.app import BATCH_OPERATIONS, is_pure
+        cacheable = {name for name, (_, build) in BATCH_OPERATIONS.items() if is_pure(build)}
+        assert cacheable == {'layer'}
+    
+    def test_health_check_tracks_connections(self, client):
+        """Test the cached health body follows connection changes"""
+        from server.app import update_health
+        update_health(2)
+        try:
+            assert client.get('/').get_json()['connections'] == 2
+        finally:
+            update_health(0)
+    
+    def test_clear_cache(self, client):
+        """Test clearing the LISP result cache"""
+        response = client.post('/api/cache/clear')
+        assert response.status_code == 200
+        assert response.get_json()['success'] == True
+    
+    def test_malformed_json_body(self, client):
+        """Test that an unparseable JSON body is rejected"""
+        response = client.post('/api/drawing/wall', data='{"start_point": ',
+                               content_type='application/json')
+        assert response.status_code == 400
+        assert "Invalid JSON body" in response.get_json()['message']
+    
+    def test_execute_lisp_event_stream(self, client):
+        """Test that LISP execution can be streamed as server-sent events"""
+        response = client.post('/api/lisp/execute', json={'lisp_code': '(princ)'},
+                               headers={'Accept': 'text/event-stream'})
+        assert response.status_code == 200
+        assert response.mimetype == 'text/event-stream'
+        body = response.get_data(as_text=True)
+        assert body.startswith("event: started")
+        # No AutoCAD here, so the stream ends with an error event
+        assert "event: error" in body
+    
     def test_missing_required_fields(self, client):
         """Test API with missing required fields"""
         incomplete_data = {
@@ -278,7 +473,7 @@ class TestAPIEndpoints:
         
         response = client.post('/api/drawing/wall', json=incomplete_data)
         assert response.status_code == 400
-        data = json.loads(response.data)
+        data = response.get_json()
         assert "Missing required fields" in data['error']
 
 # Integration tests (mock AutoCAD operations)
@@ -300,7 +495,8 @@ class TestIntegration:
         # This will fail without AutoCAD but we can test validation
         response = client.post('/api/drawing/room', json=room_data)
         # Should fail due to no AutoCAD connection, but validation should pass
-        assert "points" in str(response.data) or "AutoCAD" in str(response.data)
+        error = response.get_json().get('error', '')
+        assert "points" in error or "AutoCAD" in error
     
     def test_furniture_placement_workflow(self, client):
         """Test furniture placement workflow"""
@@ -314,7 +510,529 @@ class TestIntegration:
         # This will fail without AutoCAD but we can test validation
         response = client.post('/api/furniture/insert', json=furniture_data)
         # Should fail due to no AutoCAD connection, but validation should pass
-        assert "furniture_type" in str(response.data) or "AutoCAD" in str(response.data)
+        error = response.get_json().get('error', '')
+        assert "furniture_type" in error or "AutoCAD" in error
+
+# Request schema tests
+class TestSchemas:
+    
+    def test_schema_coerces_fields(self):
+        """Test compiled schemas return native types"""
+        data = DOOR_SCHEMA({
+            "wall_reference": "wall_1",
+            "position": {"x": 50, "y": 0},
+            "width": "36",
+            "height": 84,
+            "swing_direction": "left_in"
+        })
+        assert data['position'] == (50.0, 0.0, 0.0)
+        assert data['width'] == 36.0
+        assert data['swing_direction'] == SwingDirection.LEFT_IN
+        assert data['door_type'].value == "SINGLE"
+        assert data['instance_id'] is None
+    
+    def test_schema_missing_fields(self):
+        """Test compiled schemas report all missing fields"""
+        with pytest.raises(ValidationError, match="end_point, thickness, height"):
+            WALL_SCHEMA({"start_point": {"x": 0, "y": 0}})
+    
+    def test_schema_rejects_invalid_values(self):
+        """Test compiled schemas reject values that fail coercion"""
+        wall_data = {
+            "start_point": {"x": 0, "y": 0},
+            "end_point": {"x": 100, "y": 0},
+            "thickness": -6,
+            "height": 96
+        }
+        with pytest.raises(ValidationError, match="thickness"):
+            WALL_SCHEMA(wall_data)
+        with pytest.raises(ValidationError):
+            WALL_SCHEMA(None)
+
+    def test_schema_rejects_unknown_enum_value(self):
+        """Test enum fields list the accepted values"""
+        with pytest.raises(ValidationError, match="must be one of left_in"):
+            DOOR_SCHEMA({
+                "wall_reference": "wall_1",
+                "position": {"x": 50, "y": 0},
+                "width": 36,
+                "height": 84,
+                "swing_direction": "sideways"
+            })
+
+# Connection pool tests (fake interface, no AutoCAD required)
+class FakeInterface:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.connected = []
+    
+    def connect_to_autocad(self, instance_id):
+        if self.fail:
+            raise AutoCADConnectionError("AutoCAD not available")
+        self.connected.append(instance_id)
+        return AutoCADConnection(instance_id=instance_id, connected=True)
+    
+    def is_connection_alive(self, connection):
+        return connection.connected
+    
+    def disconnect(self, instance_id):
+        return True
+
+class TestConnectionPool:
+    
+    def test_warm_fills_pool(self):
+        """Test warming opens min_size connections"""
+        interface = FakeInterface()
+        pool = AutoCADPool(interface, min_size=2, max_size=3, timeout=0.01)
+        assert pool.warm() == 2
+        assert interface.connected == ["pool-0", "pool-1"]
+    
+    def test_acquire_reuses_connections(self):
+        """Test released connections are handed out again"""
+        interface = FakeInterface()
+        pool = AutoCADPool(interface, max_size=1, timeout=0.01)
+        with pool.acquire() as first:
+            pass
+        with pool.acquire() as second:
+            assert second is first
+        assert interface.connected == ["pool-0"]
+    
+    def test_acquire_times_out_when_exhausted(self):
+        """Test acquiring from an exhausted pool raises a timeout error"""
+        pool = AutoCADPool(FakeInterface(), max_size=1, timeout=0.01)
+        with pool.acquire():
+            with pytest.raises(AutoCADPoolTimeoutError):
+                with pool.acquire():
+                    pass
+    
+    def test_warm_without_autocad(self):
+        """Test warming stops quietly when AutoCAD cannot be reached"""
+        pool = AutoCADPool(FakeInterface(fail=True), min_size=2, timeout=0.01)
+        assert pool.warm() == 0
+    
+    def test_failed_connect_frees_slot(self):
+        """Test a failed connection attempt gives its slot back"""
+        interface = FakeInterface(fail=True)
+        pool = AutoCADPool(interface, max_size=1, timeout=0.01)
+        with pytest.raises(AutoCADConnectionError):
+            with pool.acquire():
+                pass
+        interface.fail = False
+        with pool.acquire() as connection:
+            assert connection.instance_id == "pool-1"
+    
+    def test_connect_runs_without_lock(self):
+        """Test other threads can use the pool while a connection is opening"""
+        interface = FakeInterface()
+        pool = AutoCADPool(interface, max_size=2, timeout=0.01)
+        connect = interface.connect_to_autocad
+        def try_lock():
+            results.append(pool._lock.acquire(timeout=0.5))
+            if results[-1]:
+                pool._lock.release()
+        def connect_checking_lock(instance_id):
+            locked = threading.Thread(target=try_lock)
+            locked.start()
+            locked.join()
+            return connect(instance_id)
+        results = []
+        interface.connect_to_autocad = connect_checking_lock
+        with pool.acquire():
+            pass
+        assert results == [True]
+    
+    def test_dead_connection_is_recycled(self):
+        """Test a dead idle connection is replaced on checkout"""
+        interface = FakeInterface()
+        pool = AutoCADPool(interface, max_size=1, timeout=0.01)
+        with pool.acquire() as first:
+            first.connected = False
+        with pool.acquire() as second:
+            assert second.instance_id == "pool-1"
+
+# LISP result cache tests
+class TestResultCache:
+    
+    @pytest.fixture
+    def interface(self, make_interface, monkeypatch):
+        interface = make_interface(result_cache_size=2)
+        interface.sent = []
+        def fake_execute(lisp_code, instance_id):
+            interface.sent.append(lisp_code)
+            return LispExecutionResult(success=True, result="Command executed")
+        monkeypatch.setattr(interface, '_execute_lisp', fake_execute)
+        return interface
+    
+    def test_cacheable_lisp_sent_once(self, interface):
+        """Test identical cacheable LISP is only sent to AutoCAD once"""
+        first = interface.execute_lisp('(command "._LAYER")', cacheable=True)
+        second = interface.execute_lisp('(command "._LAYER")', cacheable=True)
+        assert second is first
+        assert len(interface.sent) == 1
+    
+    def test_uncacheable_lisp_always_sent(self, interface):
+        """Test LISP is re-sent unless marked cacheable"""
+        interface.execute_lisp('(command "._LINE")')
+        interface.execute_lisp('(command "._LINE")')
+        assert len(interface.sent) == 2
+    
+    def test_cache_is_clearable(self, interface):
+        """Test clearing the cache forces the next request to be sent"""
+        interface.execute_lisp('(a)', cacheable=True)
+        assert interface.clear_result_cache() == 1
+        interface.execute_lisp('(a)', cacheable=True)
+        assert len(interface.sent) == 2
+    
+    def test_other_lisp_invalidates_cache(self, interface):
+        """Test A -> B -> A re-sends A, since B may have changed what A set up"""
+        for code in ('(layer "A" 1)', '(layer "A" 2)', '(layer "A" 1)'):
+            interface.execute_lisp(code, cacheable=True)
+        assert interface.sent == ['(layer "A" 1)', '(layer "A" 2)', '(layer "A" 1)']
+    
+    def test_uncacheable_lisp_invalidates_cache(self, interface):
+        """Test user LISP between identical cacheable requests drops the cached result"""
+        interface.execute_lisp('(layer "A" 1)', cacheable=True)
+        interface.execute_lisp('(command "._LAYER" "D" "A" "")')
+        interface.execute_lisp('(layer "A" 1)', cacheable=True)
+        assert len(interface.sent) == 3
+    
+    def test_load_lisp_file_sends_load_form(self, interface, tmp_path):
+        """Test LISP files are loaded by path rather than by content"""
+        lisp_file = tmp_path / "tools.lsp"
+        lisp_file.write_text("(defun c:hello () (princ))")
+        assert interface.load_lisp_file(str(lisp_file)).success
+        assert interface.sent == [f'(load "{lisp_file.as_posix()}")']
+        assert not interface.load_lisp_file(str(tmp_path / "missing.lsp")).success
+    
+    def test_set_current_layer_escapes_name(self, interface):
+        """Test layer names are escaped in the CLAYER command"""
+        interface.set_current_layer('A"B')
+        assert interface.sent == ['(setvar "CLAYER" "A\\"B")']
+
+# LISP dispatcher tests
+class TestLispBatching:
+    
+    def test_queued_submissions_share_one_call(self, make_interface, monkeypatch):
+        """Test LISP queued while AutoCAD is busy goes out as one progn"""
+        interface = make_interface()
+        sent = []
+        busy = threading.Event()
+        release = threading.Event()
+        def fake_execute(lisp_code, instance_id):
+            sent.append(lisp_code)
+            busy.set()
+            release.wait(1)
+            return LispExecutionResult(success=True, result="Command executed")
+        monkeypatch.setattr(interface, '_execute_lisp', fake_execute)
+        
+        first = threading.Thread(target=interface.execute_lisp, args=('(a)',),
+                                 kwargs={'batchable': True})
+        first.start()
+        busy.wait(1)
+        waiting = [threading.Thread(target=interface.execute_lisp, args=(code,),
+                                    kwargs={'batchable': True})
+                   for code in ('(b)', '(c)')]
+        for thread in waiting:
+            thread.start()
+        while interface._worker.tasks.qsize() < 2:
+            time.sleep(0.001)
+        release.set()
+        for thread in [first] + waiting:
+            thread.join(1)
+        
+        assert sent[0] == '(a)'
+        assert len(sent) == 2
+        assert sent[1].startswith("(progn") and "(b)" in sent[1] and "(c)" in sent[1]
+
+    def test_pooled_connections_share_a_batch(self, make_interface, monkeypatch):
+        """Test concurrent LISP on pooled connections to one AutoCAD is coalesced"""
+        interface = make_interface()
+        app = object()
+        interface.connections = {f"pool-{n}": AutoCADConnection(f"pool-{n}", application=app,
+                                                                connected=True)
+                                 for n in range(3)}
+        sent = []
+        busy = threading.Event()
+        release = threading.Event()
+        def fake_execute(lisp_code, instance_id):
+            sent.append(lisp_code)
+            busy.set()
+            release.wait(1)
+            return LispExecutionResult(success=True, result="Command executed")
+        monkeypatch.setattr(interface, '_execute_lisp', fake_execute)
+        
+        first = threading.Thread(target=interface.execute_lisp, args=('(a)', 'pool-0'),
+                                 kwargs={'batchable': True})
+        first.start()
+        busy.wait(1)
+        waiting = [threading.Thread(target=interface.execute_lisp, args=(code, instance_id),
+                                    kwargs={'batchable': True})
+                   for code, instance_id in (('(b)', 'pool-1'), ('(c)', 'pool-2'))]
+        for thread in waiting:
+            thread.start()
+        while interface._worker.tasks.qsize() < 2:
+            time.sleep(0.001)
+        release.set()
+        for thread in [first] + waiting:
+            thread.join(1)
+        
+        assert sent[0] == '(a)'
+        assert len(sent) == 2
+        assert sent[1].startswith("(progn") and "(b)" in sent[1] and "(c)" in sent[1]
+    
+    def test_user_lisp_is_never_batched(self, make_interface, monkeypatch):
+        """Test user-supplied LISP runs alone and gets its own result"""
+        interface = make_interface()
+        sent = []
+        busy = threading.Event()
+        release = threading.Event()
+        def fake_execute(lisp_code, instance_id):
+            sent.append(lisp_code)
+            busy.set()
+            release.wait(1)
+            return LispExecutionResult(success=lisp_code != '(bad)', result=lisp_code)
+        monkeypatch.setattr(interface, '_execute_lisp', fake_execute)
+        
+        results = {}
+        def run(code):
+            results[code] = interface.execute_lisp(code)
+        first = threading.Thread(target=run, args=('(a)',))
+        first.start()
+        busy.wait(1)
+        waiting = [threading.Thread(target=run, args=(code,)) for code in ('(bad)', '(c)')]
+        for thread in waiting:
+            thread.start()
+        while interface._worker.tasks.qsize() < 2:
+            time.sleep(0.001)
+        release.set()
+        for thread in [first] + waiting:
+            thread.join(1)
+        
+        assert sorted(sent) == ['(a)', '(bad)', '(c)']
+        assert results['(c)'].success and results['(c)'].result == '(c)'
+        assert not results['(bad)'].success
+
+    def test_calls_keep_fifo_order_with_lisp(self, make_interface, monkeypatch):
+        """Test a callable queued after LISP runs after that LISP"""
+        interface = make_interface()
+        order = []
+        release = threading.Event()
+        monkeypatch.setattr(interface, '_execute_lisp', lambda lisp_code, instance_id: (
+            order.append(lisp_code), LispExecutionResult(success=True))[1])
+        busy = threading.Event()
+        def block():
+            busy.set()
+            release.wait(1)
+        interface._worker._ensure_started()
+        interface._worker.tasks.put((block, (), Future()))
+        busy.wait(1)
+        draw = threading.Thread(target=interface.execute_lisp, args=('(draw)',),
+                                kwargs={'batchable': True})
+        draw.start()
+        while interface._worker.tasks.qsize() < 1:
+            time.sleep(0.001)
+        save = threading.Thread(target=interface._worker.call, args=(order.append, 'save'))
+        save.start()
+        while interface._worker.tasks.qsize() < 2:
+            time.sleep(0.001)
+        release.set()
+        draw.join(1)
+        save.join(1)
+        
+        assert order == ['(draw)', 'save']
+
+    def test_worker_wait_times_out(self, make_interface):
+        """Test a stuck COM worker surfaces as a pool timeout instead of blocking forever"""
+        interface = make_interface(timeout=0.05)
+        release = threading.Event()
+        interface._worker._ensure_started()
+        interface._worker.tasks.put((release.wait, (1,), Future()))
+        with pytest.raises(AutoCADPoolTimeoutError):
+            interface._worker.call(time.time)
+        release.set()
+
+    def test_timed_out_work_is_not_run_later(self, make_interface):
+        """Test work whose caller timed out is withdrawn instead of running late"""
+        interface = make_interface(timeout=0.05)
+        release = threading.Event()
+        ran = []
+        interface._worker._ensure_started()
+        interface._worker.tasks.put((release.wait, (1,), Future()))
+        with pytest.raises(AutoCADPoolTimeoutError):
+            interface._worker.call(ran.append, 'late')
+        release.set()
+        interface._worker.call(ran.append, 'next')
+        assert ran == ['next']
+    
+    def test_com_init_failure_fails_fast(self, make_interface, monkeypatch):
+        """Test a worker that cannot initialize COM fails submissions immediately"""
+        interface = make_interface(timeout=5)
+        def broken():
+            raise AutoCADConnectionError("Failed to initialize COM library")
+        monkeypatch.setattr(interface, '_initialize_com', broken)
+        start = time.monotonic()
+        with pytest.raises(AutoCADConnectionError):
+            interface._worker.call(time.time)
+        assert time.monotonic() - start < 1
+    
+    def test_com_calls_run_on_worker_thread(self, make_interface):
+        """Test COM work is pinned to the worker thread and errors propagate"""
+        interface = make_interface()
+        assert interface._worker.call(threading.current_thread) is interface._worker
+        with pytest.raises(AutoCADConnectionError):
+            interface.connect_to_autocad("worker-test")
+
+# Support path registration tests
+class FakePreferences:
+    def __init__(self, support_path):
+        self.Files = type("Files", (), {"SupportPath": support_path})()
+
+class TestSupportPath:
+    
+    def test_similar_path_is_not_a_match(self, make_interface):
+        """Test a directory merely containing 'lisp' does not count as registered"""
+        interface = make_interface()
+        app = type("App", (), {})()
+        app.Preferences = FakePreferences(LISP_PATH + "-old;C:/other")
+        entries = interface._register_lisp_path(app)
+        assert app.Preferences.Files.SupportPath.endswith(";" + LISP_PATH)
+        assert os.path.normcase(LISP_PATH) in entries
+    
+    def test_registered_path_is_left_alone(self, make_interface):
+        """Test an equivalent spelling of the LISP path is recognised"""
+        interface = make_interface()
+        app = type("App", (), {})()
+        support_path = "C:/other;" + LISP_PATH + "/"
+        app.Preferences = FakePreferences(support_path)
+        interface._register_lisp_path(app)
+        assert app.Preferences.Files.SupportPath == support_path
+
+# Readiness polling tests
+class TestWaitUntil:
+    
+    def test_returns_as_soon_as_ready(self):
+        """Test polling stops on the first true answer instead of sleeping it out"""
+        answers = iter([False, False, True])
+        start = time.monotonic()
+        assert _wait_until(lambda: next(answers), timeout=5, interval=0.001)
+        assert time.monotonic() - start < 1
+    
+    def test_gives_up_after_timeout(self):
+        """Test polling reports failure once the timeout passes"""
+        assert not _wait_until(lambda: False, timeout=0.01, interval=0.001)
+
+# Document caching tests (fake COM objects, no AutoCAD required)
+class FakeDocument:
+    Name = "Drawing1.dwg"
+    ModelSpace = object()
+
+class FakeApplication:
+    Name = "AutoCAD"
+    
+    def __init__(self):
+        self.lookups = 0
+    
+    @property
+    def ActiveDocument(self):
+        self.lookups += 1
+        return FakeDocument()
+
+class SnapshotDocument:
+    Name = "Plan.dwg"
+    FullName = "C:/plans/Plan.dwg"
+    Saved = True
+    ReadOnly = False
+
+class CountingApplication:
+    def __init__(self):
+        self.probes = 0
+    
+    @property
+    def Name(self):
+        self.probes += 1
+        return "AutoCAD"
+
+class TestDocumentCache:
+    
+    def test_list_connections_reads_cached_documents(self, make_interface):
+        """Test connection listing uses each connection's cached document"""
+        interface = make_interface()
+        live = AutoCADConnection("live", application=object(), connected=True,
+                                 document=SnapshotDocument())
+        dead = AutoCADConnection("dead", application=None, connected=True)
+        interface.connections = {"live": live, "dead": dead}
+        
+        assert interface.list_connections() == [
+            {"instance_id": "live", "connected": True, "document_name": "Plan.dwg"},
+            {"instance_id": "dead", "connected": False, "document_name": "Unknown"}
+        ]
+    
+    def test_snapshot_re_resolves_closed_document(self, make_interface):
+        """Test a closed cached document is re-resolved instead of marking the connection dead"""
+        class ClosedDocument:
+            @property
+            def Name(self):
+                raise Exception("The object invoked has disconnected from its clients")
+        class SwitchedApplication:
+            ActiveDocument = SnapshotDocument()
+        interface = make_interface()
+        connection = AutoCADConnection("switched", application=SwitchedApplication(),
+                                       connected=True, document=ClosedDocument())
+        interface.connections = {"switched": connection}
+        
+        assert interface.list_connections() == [
+            {"instance_id": "switched", "connected": True, "document_name": "Plan.dwg"}
+        ]
+        assert connection.document is SwitchedApplication.ActiveDocument
+    
+    def test_liveness_probe_is_cached(self, make_interface):
+        """Test a successful liveness probe is reused until the TTL expires"""
+        interface = make_interface()
+        app = CountingApplication()
+        connection = AutoCADConnection("alive-test", application=app, connected=True)
+        
+        assert interface.is_connection_alive(connection)
+        assert interface.is_connection_alive(connection)
+        assert app.probes == 1
+        connection.last_alive_check = 0.0
+        assert interface.is_connection_alive(connection)
+        assert app.probes == 2
+    
+    def test_connect_reuses_live_application(self, make_interface, monkeypatch):
+        """Test a new connection shares a live connection's application and support paths"""
+        interface = make_interface()
+        app = FakeApplication()
+        interface.connections = {"pool-0": AutoCADConnection(
+            "pool-0", application=app, connected=True, support_paths=frozenset({"c:/lisp"}))}
+        monkeypatch.setattr(interface, '_register_lisp_path', lambda app: pytest.fail("re-registered"))
+        
+        connection = interface.connect_to_autocad("pool-1")
+        assert connection.application is app
+        assert connection.support_paths == frozenset({"c:/lisp"})
+    
+    def test_new_application_registers_support_path(self, make_interface, monkeypatch):
+        """Test a freshly attached AutoCAD (e.g. after a restart) gets its support path checked"""
+        interface = make_interface()
+        app = FakeApplication()
+        interface.connections = {"old": AutoCADConnection("old", application=None, connected=True,
+                                                          support_paths=frozenset({"stale"}))}
+        monkeypatch.setattr(interface, '_attach_application', lambda: app)
+        monkeypatch.setattr(interface, '_register_lisp_path', lambda app: frozenset({"c:/lisp"}))
+        
+        connection = interface.connect_to_autocad("fresh")
+        assert connection.application is app
+        assert connection.support_paths == frozenset({"c:/lisp"})
+    
+    def test_document_resolved_once(self, make_interface):
+        """Test the active document is looked up once and then reused"""
+        interface = make_interface()
+        app = FakeApplication()
+        connection = AutoCADConnection("doc-test", application=app, connected=True)
+        
+        first = interface._ensure_document(connection)
+        assert interface._ensure_document(connection) is first
+        assert connection.model_space is FakeDocument.ModelSpace
+        assert app.lookups == 1
 
 # Performance tests
 class TestPerformance:
@@ -333,7 +1051,7 @@ class TestPerformance:
         response = client.post('/api/utils/calculate_area', 
                               json={'points': points})
         assert response.status_code == 200
-        data = json.loads(response.data)
+        data = response.get_json()
         assert data['success'] == True
         # Area should be approximately π * 50² = 7854
         assert abs(data['area'] - 7854) < 100  # Allow some tolerance for approximation
@@ -0,0 +1,10 @@
+"""
+WSGI entrypoint for running the AutoCAD MCP Server under a production server
+
+    waitress-serve --threads=8 --listen=127.0.0.1:5000 wsgi:app
+"""
+from server.app import app, autocad_pool
+
+application = app  # default name looked up by most WSGI servers
+
+autocad_pool.warm_in_background()